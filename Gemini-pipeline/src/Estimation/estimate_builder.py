@@ -10,29 +10,49 @@ from __future__ import annotations
 
 import argparse
 import csv
+import functools
 import hashlib
+import heapq
+import itertools
 import json
 import logging
 import math
 import os
 import random
 import re
+import string
 import sys
 import textwrap
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timezone
 from decimal import Decimal, ROUND_HALF_UP
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, TypedDict
 
 from jsonschema import Draft7Validator, ValidationError
 
-try:
+if TYPE_CHECKING:
     import google.genai as genai
-except ImportError as exc:
-    raise RuntimeError(
-        "google-genai is required. Install it with 'pip install google-genai'."
-    ) from exc
+
+
+def _load_genai():
+    """Import google-genai on first use, so --no-ai runs skip its import cost."""
+    try:
+        import google.genai as genai
+    except ImportError as exc:
+        raise RuntimeError(
+            "google-genai is required. Install it with 'pip install google-genai'."
+        ) from exc
+    return genai
+
+
+# JSON helpers shared with the PDF scripts (orjson when installed)
+from json_io import encode_output_json as _encode_output_json
+from json_io import loads_json as _loads_json
+from json_io import orjson
 
 
 PROJECT_ROOT = Path(__file__).resolve().parent.parent
@@ -213,6 +233,16 @@ QUALITY_THRESHOLDS = {
     "poor": 0             # 0-59: Poor estimate
 }
 
+# Grade buckets from the highest threshold down; scores below every
+# threshold (or NaN) fall through to _POOR_GRADE
+_GRADE_TABLE = (
+    (QUALITY_THRESHOLDS["excellent"], "EXCELLENT", "🌟"),
+    (QUALITY_THRESHOLDS["good"], "GOOD", "✅"),
+    (QUALITY_THRESHOLDS["acceptable"], "ACCEPTABLE", "👍"),
+    (QUALITY_THRESHOLDS["needs_review"], "NEEDS REVIEW", "⚠️"),
+)
+_POOR_GRADE = ("POOR", "❌")
+
 # Expected priority distribution (target percentages)
 # Based on typical home inspection findings
 EXPECTED_PRIORITY_DISTRIBUTION = {
@@ -221,6 +251,109 @@ EXPECTED_PRIORITY_DISTRIBUTION = {
     "LOW": 0.20,       # 20% should be low priority (maintenance/cosmetic)
 }
 
+# Fixed count slot per priority; unknown priorities are counted as MEDIUM
+_PRIORITY_SLOTS = {p: i for i, p in enumerate(EXPECTED_PRIORITY_DISTRIBUTION)}
+_MEDIUM_SLOT = _PRIORITY_SLOTS["MEDIUM"]
+
+
+def _dumps_indented(obj: Any) -> str:
+    """Serialize obj as 2-space indented JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+
+def _dumps_compact(obj: Any) -> str:
+    """Serialize obj as whitespace-free JSON, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+# Raw bytes of recently read or written cache files, most recent last.
+# Entries are re-parsed on every hit because callers mutate the items they
+# get back (stabilize_prices, regional adjustment).
+_CACHE_MEMO_SIZE = 32
+_cache_memo: "OrderedDict[str, bytes]" = OrderedDict()
+
+
+def _remember_cache_bytes(path: Path, data: bytes) -> None:
+    key = str(path)
+    _cache_memo[key] = data
+    _cache_memo.move_to_end(key)
+    if len(_cache_memo) > _CACHE_MEMO_SIZE:
+        _cache_memo.popitem(last=False)
+
+
+def _read_cache_file(path: Path) -> Optional[Any]:
+    """
+    Load a JSON cache file, or None when it does not exist.
+
+    Files already seen by this process are served from memory.
+    """
+    key = str(path)
+    data = _cache_memo.get(key)
+    if data is not None:
+        _cache_memo.move_to_end(key)
+    else:
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        _remember_cache_bytes(path, data)
+    return _loads_json(data)
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    """
+    Write data to path in one call via a sibling temp file.
+
+    The temp file is renamed over path, so an interrupted run never leaves
+    a truncated file behind.
+    """
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def _write_cache_file(path: Path, obj: Any) -> None:
+    """Write a JSON cache file with 2-space indentation, atomically."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, indent=2).encode()
+    _write_bytes_atomic(path, data)
+    _remember_cache_bytes(path, data)
+
+
+@dataclass
+class _CategoryTally:
+    """Issue and line-item counts for one pricing category."""
+
+    __slots__ = ("issue_count", "item_count")
+
+    issue_count: int
+    item_count: int
+
+
+def _r2(value: float) -> float:
+    """Round half-up to two decimals (cents) without the generic round() path."""
+    if not math.isfinite(value):
+        return value
+    return int(value * 100 + (0.5 if value >= 0 else -0.5)) / 100.0
+
+
+def _canonical_category(category: Optional[str]) -> str:
+    """Upper-case and strip a category, defaulting empty values to MISCELLANEOUS.
+
+    The result is interned so repeated categories share one string object;
+    dict lookups can then short-circuit on identity when the key is the
+    same object, and otherwise fall back to the usual hash/eq comparison.
+    """
+    if category:
+        return sys.intern(category.upper().strip())
+    return "MISCELLANEOUS"
+
 
 def get_base_price(category: str, severity: str) -> float:
     """
@@ -331,7 +464,7 @@ def calculate_consolidated_price(
         f"After regional ({regional_multiplier}x)=${final_price:.2f}"
     )
 
-    return round(final_price, 2)
+    return _r2(final_price)
 
 
 def get_consolidation_guidance(category: str, issue_count: int) -> Dict[str, Any]:
@@ -497,39 +630,36 @@ def validate_all_category_consolidation(
             "overall_ratio": 3.75
         }
     """
-    # Group issues by category (using mapped pricing categories)
-    issues_by_category = {}
+    # Count issues by category (using mapped pricing categories).
+    # Only counts are needed, so keep one slotted tally per category
+    # instead of materializing per-category lists.
+    tallies: Dict[str, _CategoryTally] = {}
     for issue in issues:
         # Map extracted section to pricing category
         section = issue.get("section", "")
         component = issue.get("component", "")
         title = issue.get("title", "")
         cat = map_extraction_category_to_pricing(section, component, title)
-        
-        if cat not in issues_by_category:
-            issues_by_category[cat] = []
-        issues_by_category[cat].append(issue)
 
-    # Group items by category
-    items_by_category = {}
-    for item in items:
-        cat = item.get("category", "MISCELLANEOUS")
-        if cat:
-            cat = cat.upper().strip()
+        tally = tallies.get(cat)
+        if tally is None:
+            tallies[cat] = _CategoryTally(issue_count=1, item_count=0)
         else:
-            cat = "MISCELLANEOUS"
+            tally.issue_count += 1
 
-        if cat not in items_by_category:
-            items_by_category[cat] = []
-        items_by_category[cat].append(item)
+    # Count items for the categories that have issues
+    for item in items:
+        tally = tallies.get(_canonical_category(item.get("category", "MISCELLANEOUS")))
+        if tally is not None:
+            tally.item_count += 1
 
     # Validate each category
     category_validations = {}
     all_acceptable = True
 
-    for category in issues_by_category.keys():
-        issue_count = len(issues_by_category[category])
-        item_count = len(items_by_category.get(category, []))
+    for category, tally in tallies.items():
+        issue_count = tally.issue_count
+        item_count = tally.item_count
 
         if item_count == 0:
             LOGGER.warning(
@@ -555,7 +685,7 @@ def validate_all_category_consolidation(
     }
 
     # Summary logging
-    acceptable_count = sum(1 for v in category_validations.values() if v["is_acceptable"])
+    acceptable_count = sum(v["is_acceptable"] for v in category_validations.values())
     total_categories = len(category_validations)
 
     LOGGER.info(
@@ -597,7 +727,7 @@ def score_consolidation_quality(
     else:
         # Calculate how many categories are acceptable
         category_vals = validation["category_validations"]
-        acceptable_count = sum(1 for v in category_vals.values() if v["is_acceptable"])
+        acceptable_count = sum(v["is_acceptable"] for v in category_vals.values())
         total_count = len(category_vals)
 
         # Score proportional to acceptable categories
@@ -711,20 +841,16 @@ def score_priority_distribution(issues: List[Dict[str, Any]]) -> Dict[str, Any]:
             "expected_distribution": {}
         }
 
-    # Count priorities
-    priority_counts = {"HIGH": 0, "MEDIUM": 0, "LOW": 0}
+    # Count priorities into fixed slots (unknown/missing default to MEDIUM)
+    slot_counts = [0] * len(_PRIORITY_SLOTS)
     for issue in issues:
         priority = issue.get("priority", "MEDIUM")
         if priority:
-            priority = priority.upper().strip()
+            slot_counts[_PRIORITY_SLOTS.get(priority.upper().strip(), _MEDIUM_SLOT)] += 1
         else:
-            priority = "MEDIUM"
+            slot_counts[_MEDIUM_SLOT] += 1
 
-        if priority in priority_counts:
-            priority_counts[priority] += 1
-        else:
-            # Unknown priority, default to MEDIUM
-            priority_counts["MEDIUM"] += 1
+    priority_counts = dict(zip(_PRIORITY_SLOTS, slot_counts))
 
     total = len(issues)
 
@@ -834,17 +960,12 @@ def score_category_distribution(items: List[Dict[str, Any]]) -> Dict[str, Any]:
         }
 
     # Count items per category
-    category_counts = {}
-    for item in items:
-        cat = item.get("category", "MISCELLANEOUS")
-        if cat:
-            cat = cat.upper().strip()
-        else:
-            cat = "MISCELLANEOUS"
-        category_counts[cat] = category_counts.get(cat, 0) + 1
+    category_counts = Counter(
+        _canonical_category(item.get("category", "MISCELLANEOUS")) for item in items
+    )
 
     total = len(items)
-    max_count = max(category_counts.values()) if category_counts else 0
+    max_count = category_counts.most_common(1)[0][1] if category_counts else 0
     max_ratio = max_count / total if total > 0 else 0
 
     # Penalize if one category dominates (>60% is problematic)
@@ -883,7 +1004,10 @@ def calculate_quality_score(
         items: All estimate items
 
     Returns:
-        Dict with overall score, grade, breakdown by factor, and review flag
+        Dict with overall score, grade, breakdown by factor, and review flag.
+        When either input is empty the factors are not scored: the result is
+        a POOR grade with an empty breakdown and "empty": True, so callers
+        must not assume every factor is present in the breakdown.
 
     Example:
         {
@@ -893,6 +1017,18 @@ def calculate_quality_score(
             "needs_review": False
         }
     """
+    # Nothing to score - skip the per-factor scorers entirely
+    if not items or not issues:
+        return {
+            "overall_score": 0,
+            "grade": "POOR",
+            "emoji": "❌",
+            "breakdown": {},
+            "needs_review": True,
+            "thresholds": QUALITY_THRESHOLDS,
+            "empty": True
+        }
+
     # Calculate individual scores
     consolidation_score = score_consolidation_quality(issues, items)
     price_score = score_price_consistency(items)
@@ -910,21 +1046,11 @@ def calculate_quality_score(
     )
 
     # Determine quality grade
-    if total_score >= QUALITY_THRESHOLDS["excellent"]:
-        grade = "EXCELLENT"
-        emoji = "🌟"
-    elif total_score >= QUALITY_THRESHOLDS["good"]:
-        grade = "GOOD"
-        emoji = "✅"
-    elif total_score >= QUALITY_THRESHOLDS["acceptable"]:
-        grade = "ACCEPTABLE"
-        emoji = "👍"
-    elif total_score >= QUALITY_THRESHOLDS["needs_review"]:
-        grade = "NEEDS REVIEW"
-        emoji = "⚠️"
+    for threshold, grade, emoji in _GRADE_TABLE:
+        if total_score >= threshold:
+            break
     else:
-        grade = "POOR"
-        emoji = "❌"
+        grade, emoji = _POOR_GRADE
 
     needs_review = total_score < QUALITY_THRESHOLDS["acceptable"]
 
@@ -956,6 +1082,39 @@ DISCLAIMER_TEMPLATES = {
     "GENERAL": "Estimate reflects Texas state market conditions as of 2024-2025.",
 }
 
+
+@dataclass(frozen=True)
+class _CategoryProfile:
+    """Consolidation limits and disclaimer resolved once per category."""
+
+    __slots__ = ("max_per_item", "target_ratio", "disclaimer")
+
+    max_per_item: int
+    target_ratio: float
+    disclaimer: str
+
+
+def _build_category_profile(category: str) -> _CategoryProfile:
+    rules = CATEGORY_CONSOLIDATION_RULES.get(category, CATEGORY_CONSOLIDATION_RULES["MISCELLANEOUS"])
+    return _CategoryProfile(
+        max_per_item=rules["max_per_item"],
+        target_ratio=rules["target_ratio"],
+        disclaimer=DISCLAIMER_TEMPLATES.get(category, ""),
+    )
+
+
+_CATEGORY_PROFILES = {
+    category: _build_category_profile(category)
+    for category in CATEGORY_CONSOLIDATION_RULES.keys() | DISCLAIMER_TEMPLATES.keys()
+}
+# Unknown categories consolidate like MISCELLANEOUS but carry no disclaimer
+_DEFAULT_CATEGORY_PROFILE = _build_category_profile("")
+
+
+def _category_profile(category: str) -> _CategoryProfile:
+    """Look up the consolidation profile for a category."""
+    return _CATEGORY_PROFILES.get(category, _DEFAULT_CATEGORY_PROFILE)
+
 # Texas regional adjustment factors
 TEXAS_REGIONAL_MULTIPLIERS = {
     "Dallas-Fort Worth": 1.05,
@@ -971,32 +1130,28 @@ TEXAS_REGIONAL_MULTIPLIERS = {
 }
 
 
-def create_individual_pricing_prompt(issue: Dict[str, Any], pricebook: Dict[str, Any]) -> str:
-    """
-    Create pricing prompt for a SINGLE issue.
-
-    Version: 7.0 - Two-phase approach: Individual pricing (no consolidation)
-    """
-
-    issue_json = json.dumps(issue, indent=2)
-    category = issue.get("suggested_category", "MISCELLANEOUS")
+# Pre-formatted severity price ranges (base to 3x base) per category for the
+# individual pricing prompt
+_PRICING_GUIDELINE_BLOCKS = {
+    category: "\n".join(
+        f"- {severity.title()}: ${prices[severity]:.0f}-{prices[severity]*3:.0f}"
+        for severity in ("minor", "moderate", "major", "critical")
+    )
+    for category, prices in CATEGORY_SEVERITY_PRICE_MATRIX.items()
+}
 
-    # Get category-specific pricing guidance
-    severity_prices = CATEGORY_SEVERITY_PRICE_MATRIX.get(category, CATEGORY_SEVERITY_PRICE_MATRIX["MISCELLANEOUS"])
 
-    return f'''
+# Individual pricing prompt. {issue_json} splits it into a head and a tail;
+# the head's placeholders depend only on the category (literal braces are
+# escaped as {{ }}). The issue goes last so every request for a category
+# shares one long, stable prefix that Gemini's implicit caching can reuse.
+_INDIVIDUAL_PRICING_PROMPT = '''
 You are a Texas-licensed contractor pricing a SINGLE repair item.
 
-ISSUE TO PRICE:
-{issue_json}
-
 CATEGORY: {category}
 
 PRICING GUIDELINES FOR {category}:
-- Minor: ${severity_prices.get("minor", 100):.0f}-{severity_prices.get("minor", 100)*3:.0f}
-- Moderate: ${severity_prices.get("moderate", 200):.0f}-{severity_prices.get("moderate", 200)*3:.0f}
-- Major: ${severity_prices.get("major", 400):.0f}-{severity_prices.get("major", 400)*3:.0f}
-- Critical: ${severity_prices.get("critical", 600):.0f}-{severity_prices.get("critical", 600)*3:.0f}
+{guidelines}
 
 TEXAS MARKET CONTEXT (2025):
 - Houston metro area pricing
@@ -1029,38 +1184,61 @@ CRITICAL RULES:
 3. Use EXACT category name: {category}
 4. Price accurately based on Texas market rates
 5. This is ONE issue - bundled_issues must be 1
+
+ISSUE TO PRICE:
+{issue_json}
 '''
+_INDIVIDUAL_PROMPT_HEAD, _, _INDIVIDUAL_PROMPT_TAIL = _INDIVIDUAL_PRICING_PROMPT.partition("{issue_json}")
 
 
-def create_enhanced_pricing_prompt(issues: List[Dict[str, Any]], pricebook: Dict[str, Any]) -> str:
-        """
-        Create pricing prompt focused on ACCURACY and MARKET RATES.
+@functools.lru_cache(maxsize=16)
+def _individual_prompt_static(category: str) -> Tuple[str, str]:
+    """
+    Static text of the individual pricing prompt for one category.
 
-        Version: 4.0 - Removed artificial constraints, added pricing guardrails
-        DEPRECATED: Use create_individual_pricing_prompt + code-based consolidation instead
-        """
+    Returns the (head, tail) text that surrounds the issue JSON. Everything
+    except the issue itself depends only on the category, so it is rendered
+    once per category and reused for every issue.
+    """
+    # Get category-specific pricing guidance
+    guidelines = _PRICING_GUIDELINE_BLOCKS.get(category, _PRICING_GUIDELINE_BLOCKS["MISCELLANEOUS"])
 
-        issues_json = json.dumps(issues, indent=2)
-        issue_count = len(issues)
+    head = _INDIVIDUAL_PROMPT_HEAD.format_map({"category": category, "guidelines": guidelines})
+    return head, _INDIVIDUAL_PROMPT_TAIL
 
-        # Group issues by category for consolidation guidance
-        category_counts = {}
-        for issue in issues:
-            cat = issue.get("suggested_category", "MISCELLANEOUS")
-            category_counts[cat] = category_counts.get(cat, 0) + 1
 
-        # Build category-specific consolidation guidance
-        consolidation_guidance = []
-        for cat, count in category_counts.items():
-            rules = CATEGORY_CONSOLIDATION_RULES.get(cat, CATEGORY_CONSOLIDATION_RULES["MISCELLANEOUS"])
-            target_items = max(1, round(count / rules["target_ratio"]))
-            consolidation_guidance.append(
-                f"   - {cat}: {count} issues → {target_items} line items (bundle ~{rules['target_ratio']:.1f} issues per item, max {rules['max_per_item']} per item)"
-            )
+def create_individual_pricing_prompt(issue: Dict[str, Any], pricebook: Dict[str, Any]) -> str:
+    """
+    Create pricing prompt for a SINGLE issue.
+
+    Version: 7.1 - Two-phase approach: Individual pricing (no consolidation),
+    static instructions first and the issue last
 
-        consolidation_text = "\n".join(consolidation_guidance)
+    The issue is embedded as compact JSON: the model reads it just as well
+    and it costs noticeably fewer prompt tokens than the indented form.
 
-        return f'''
+    pricebook is accepted for interface compatibility but not embedded; the
+    category price matrix is used instead. The static text per category is a
+    few hundred tokens, below Gemini's minimum for an explicit context cache,
+    so the prompt is sent whole rather than through client.caches.
+    """
+
+    issue_json = _dumps_compact(issue)
+    category = issue.get("suggested_category", "MISCELLANEOUS")
+
+    return _render_individual_prompt(issue_json, category)
+
+
+@functools.lru_cache(maxsize=1024)
+def _render_individual_prompt(issue_json: str, category: str) -> str:
+    """Assemble the individual prompt; retries of the same issue reuse the string."""
+    head, tail = _individual_prompt_static(category)
+    return head + issue_json + tail
+
+
+# Enhanced (batch) pricing prompt. Placeholders are filled by
+# create_enhanced_pricing_prompt; literal braces are escaped as {{ }}.
+_ENHANCED_PRICING_PROMPT = '''
 You are a Texas-licensed contractor creating an ACCURATE repair estimate for {issue_count} inspection findings.
 
 PRICING PHILOSOPHY:
@@ -1086,7 +1264,7 @@ PRICING PHILOSOPHY:
 
 4. CONSOLIDATION GUIDELINES (CATEGORY-SPECIFIC - MANDATORY HARD LIMITS)
 
-   🚨 **CRITICAL: THESE ARE ABSOLUTE REQUIREMENTS, NOT SUGGESTIONS** 🚨
+   **CRITICAL: THESE ARE ABSOLUTE REQUIREMENTS, NOT SUGGESTIONS**
 
    **YOU MUST CREATE EXACTLY THE NUMBER OF LINE ITEMS SHOWN BELOW:**
 
@@ -1094,56 +1272,56 @@ PRICING PHILOSOPHY:
 
    **MANDATORY CONSOLIDATION LIMITS BY CATEGORY:**
 
-   📦 **ROOF** - MAXIMUM 8 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[ROOF]** - MAXIMUM 8 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - If you have 28 roof issues: CREATE MINIMUM 4 LINE ITEMS (28÷8=3.5, round up to 4)
       - If you have 14 roof issues: CREATE MINIMUM 2 LINE ITEMS (14÷8=1.75, round up to 2)
       - Group by: roof zone, system (shingles vs flashing), or location
       - ✅ CORRECT: "Roof Zone 1 - Shingle repairs (replace 8 damaged shingles, seal 2 vents)" [8 issues]
       - ❌ WRONG: "Comprehensive roof repairs" bundling 28 issues [REJECTED - TOO MANY]
 
-   ⚡ **ELECTRICAL** - MAXIMUM 5 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[ELECTRICAL]** - MAXIMUM 5 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - If you have 25 electrical issues: CREATE MINIMUM 5 LINE ITEMS (25÷5=5)
       - If you have 20 electrical issues: CREATE MINIMUM 4 LINE ITEMS (20÷5=4)
       - Group by: circuit, room, or system (panel vs outlets vs lighting)
       - ✅ CORRECT: "Panel repairs (add 5 breaker labels, seal 3 knockouts)" [5 issues]
       - ❌ WRONG: "Electrical work" bundling 20 issues [REJECTED - TOO MANY]
 
-   🚰 **PLUMBING** - MAXIMUM 4 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[PLUMBING]** - MAXIMUM 4 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - If you have 14 plumbing issues: CREATE MINIMUM 4 LINE ITEMS (14÷4=3.5, round up to 4)
       - Group by: bathroom, fixture type, or system
       - ✅ CORRECT: "Master bath plumbing (valve repair, drain clear, faucet fix)" [3 issues]
       - ❌ WRONG: "Plumbing package" bundling 14 issues [REJECTED - TOO MANY]
 
-   🏗️ **FOUNDATION** - MAXIMUM 3 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[FOUNDATION]** - MAXIMUM 3 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - If you have 15 foundation issues: CREATE MINIMUM 5 LINE ITEMS (15÷3=5)
       - If you have 30 foundation issues: CREATE MINIMUM 10 LINE ITEMS (30÷3=10)
       - Group by: location (north wall, south wall) or type (cracks vs grading)
       - ✅ CORRECT: "North wall foundation (seal 2 cracks, improve grading)" [3 issues]
       - ❌ WRONG: "Foundation repairs" bundling 15 issues [REJECTED - TOO MANY]
 
-   ❄️ **HVAC** - MAXIMUM 3 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[HVAC]** - MAXIMUM 3 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - Group by: system or location
       - ✅ CORRECT: "HVAC repairs (install cover, secure wiring, seal duct)" [3 issues]
       - ❌ WRONG: "HVAC package" bundling 10 issues [REJECTED - TOO MANY]
 
-   🚪 **WINDOWS/DOORS** - MAXIMUM 4 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[WINDOWS/DOORS]** - MAXIMUM 4 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - If you have 13 window/door issues: CREATE MINIMUM 4 LINE ITEMS (13÷4=3.25, round up to 4)
       - Group by: room or type (interior vs exterior)
       - ✅ CORRECT: "Interior doors (install 3 stops, replace hardware)" [4 issues]
       - ❌ WRONG: "Door repairs" bundling 13 issues [REJECTED - TOO MANY]
 
-   🏠 **ATTIC** - MAXIMUM 5 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[ATTIC]** - MAXIMUM 5 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - Group by: system (insulation vs ventilation vs structure)
       - ✅ CORRECT: "Attic insulation (re-hang fallen, add to bare spots)" [4 issues]
       - ❌ WRONG: "Attic package" bundling 15 issues [REJECTED - TOO MANY]
 
-   🔧 **MISCELLANEOUS** - MAXIMUM 4 ISSUES PER LINE ITEM (NO EXCEPTIONS)
+   **[MISCELLANEOUS]** - MAXIMUM 4 ISSUES PER LINE ITEM (NO EXCEPTIONS)
       - If you have 13 misc issues: CREATE MINIMUM 4 LINE ITEMS (13÷4=3.25, round up to 4)
       - Group by: trade or location
       - ✅ CORRECT: "Appliance maintenance (clean vent, replace knobs)" [3 issues]
       - ❌ WRONG: "Misc repairs" bundling 13 issues [REJECTED - TOO MANY]
 
-   🚨 **ENFORCEMENT RULES - READ CAREFULLY:**
+   **ENFORCEMENT RULES - READ CAREFULLY:**
 
    1. **COUNT YOUR ISSUES PER CATEGORY**
    2. **DIVIDE BY MAX PER ITEM**
@@ -1220,19 +1398,19 @@ PRICING PHILOSOPHY:
    - Set "discount_justification" to explain WHY (e.g., "Same location, single mobilization")
 
    **DO NOT apply discounts for:**
-   - ❌ Arbitrary bundling without real efficiency gains
-   - ❌ Trying to hit a price target
-   - ❌ Making the estimate "look better"
+   - Arbitrary bundling without real efficiency gains
+   - Trying to hit a price target
+   - Making the estimate "look better"
 
 7. WHAT NOT TO DO
-   - ❌ DO NOT anchor to any price targets or ranges
-   - ❌ DO NOT try to fit within a specific total amount
-   - ❌ DO NOT arbitrarily reduce prices to hit a number
-   - ❌ DO NOT apply blanket percentage reductions
-   - ❌ DO NOT over-consolidate and hide critical details
-   - ❌ DO NOT under-consolidate and create too many line items
-   - ❌ DO NOT ignore the "suggested_category" field
-   - ❌ DO NOT apply discounts without clear justification
+   - DO NOT anchor to any price targets or ranges
+   - DO NOT try to fit within a specific total amount
+   - DO NOT arbitrarily reduce prices to hit a number
+   - DO NOT apply blanket percentage reductions
+   - DO NOT over-consolidate and hide critical details
+   - DO NOT under-consolidate and create too many line items
+   - DO NOT ignore the "suggested_category" field
+   - DO NOT apply discounts without clear justification
 
 ISSUES TO PRICE (with suggested categories):
 {issues_json}
@@ -1268,6 +1446,101 @@ CRITICAL RULES:
 '''
 
 
+@functools.lru_cache(maxsize=1)
+def _enhanced_prompt_static() -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Parse _ENHANCED_PRICING_PROMPT once into (literal_text, field_name) segments."""
+    return tuple(
+        (literal, field)
+        for literal, field, _, _ in string.Formatter().parse(_ENHANCED_PRICING_PROMPT)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _consolidation_guidance_text(category_counts: frozenset) -> str:
+    """
+    Category-specific consolidation guidance lines for the enhanced prompt.
+
+    Keyed by the frozenset of (category, issue_count) pairs so reports with
+    the same category distribution share one cached result. Lines are
+    ordered by category name.
+    """
+    consolidation_guidance = []
+    for cat, count in sorted(category_counts, key=lambda entry: str(entry[0])):
+        rules = CATEGORY_CONSOLIDATION_RULES.get(cat, CATEGORY_CONSOLIDATION_RULES["MISCELLANEOUS"])
+        target_items = max(1, round(count / rules["target_ratio"]))
+        consolidation_guidance.append(
+            f"   - {cat}: {count} issues → {target_items} line items (bundle ~{rules['target_ratio']:.1f} issues per item, max {rules['max_per_item']} per item)"
+        )
+
+    return "\n".join(consolidation_guidance)
+
+
+def create_enhanced_pricing_prompt(issues: List[Dict[str, Any]], pricebook: Dict[str, Any]) -> str:
+        """
+        Create pricing prompt focused on ACCURACY and MARKET RATES.
+
+        Version: 4.0 - Removed artificial constraints, added pricing guardrails
+        DEPRECATED: Use create_individual_pricing_prompt + code-based consolidation instead
+        """
+
+        issues_json = _dumps_indented(issues)
+        issue_count = len(issues)
+
+        # Group issues by category for consolidation guidance
+        category_counts = Counter(
+            issue.get("suggested_category", "MISCELLANEOUS") for issue in issues
+        )
+
+        # Build category-specific consolidation guidance
+        consolidation_text = _consolidation_guidance_text(frozenset(category_counts.items()))
+
+        values = {
+            "issue_count": str(issue_count),
+            "consolidation_text": consolidation_text,
+            "issues_json": issues_json,
+        }
+        parts = []
+        for literal, field in _enhanced_prompt_static():
+            parts.append(literal)
+            if field is not None:
+                parts.append(values[field])
+        return "".join(parts)
+
+
+# Ordered (category, section keywords, component keywords) rules for mapping
+# extraction sections/components to pricing categories. First match wins.
+_EXTRACTION_CATEGORY_RULES = (
+    ("FOUNDATION", ("foundation",), ("foundation",)),
+    ("ROOF", ("roof", "gutter", "flashing"), ("roof",)),
+    ("ATTIC", ("attic", "insulation"), ("attic",)),
+    ("PLUMBING", ("plumbing", "water", "drain"), ("plumbing",)),
+    ("ELECTRICAL", ("electrical", "outlet", "circuit", "panel"), ("electrical",)),
+    ("HVAC", ("hvac", "heating", "cooling", "air condition", "furnace"), ("hvac",)),
+    ("WINDOWS/DOORS", ("window", "door"), ("window", "door")),
+    ("MISCELLANEOUS", ("appliance", "dishwasher", "disposal", "range"), ("appliance",)),
+    # Grading/soil issues are foundation work
+    ("FOUNDATION", (), ("grading", "soil")),
+    # Exterior wood work - miscellaneous repairs
+    ("MISCELLANEOUS", (), ("wood rot", "wood trim", "siding", "decks", "porches")),
+    # Structural Systems could be foundation, roof, or walls - default to foundation
+    ("FOUNDATION", ("structural",), ()),
+)
+
+
+def _compile_keywords(keywords: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile keywords into one alternation pattern (None when empty)."""
+    if not keywords:
+        return None
+    return re.compile("|".join(map(re.escape, keywords)))
+
+
+_EXTRACTION_CATEGORY_PATTERNS = tuple(
+    (category, _compile_keywords(section_keywords), _compile_keywords(component_keywords))
+    for category, section_keywords, component_keywords in _EXTRACTION_CATEGORY_RULES
+)
+
+
+@functools.lru_cache(maxsize=4096)
 def map_extraction_category_to_pricing(section: str, component: str = "", title: str = "") -> str:
     """
     Map extraction section/component names to pricing category names.
@@ -1275,55 +1548,49 @@ def map_extraction_category_to_pricing(section: str, component: str = "", title:
     Extraction uses TREC sections and component names
     Pricing uses trade categories (e.g., "FOUNDATION", "ROOF")
     
-    Checks section, then component, then title for better categorization.
+    Rules in _EXTRACTION_CATEGORY_RULES are checked in order against the
+    section and component; the first match wins, MISCELLANEOUS otherwise.
+
+    Results are memoized: reports repeat the same section/component/title
+    triples many times.
     """
-    
-    section_lower = section.lower().strip()
-    component_lower = component.lower().strip()
-    title_lower = title.lower().strip()
-    
-    # Mapping rules - check section first
-    if 'foundation' in section_lower or 'foundation' in component_lower:
-        return 'FOUNDATION'
-    
-    elif 'roof' in section_lower or 'roof' in component_lower or 'gutter' in section_lower or 'flashing' in section_lower:
-        return 'ROOF'
-    
-    elif 'attic' in section_lower or 'attic' in component_lower or 'insulation' in section_lower:
-        return 'ATTIC'
-    
-    elif 'plumbing' in section_lower or 'plumbing' in component_lower or 'water' in section_lower or 'drain' in section_lower:
-        return 'PLUMBING'
-    
-    elif 'electrical' in section_lower or 'electrical' in component_lower or 'outlet' in section_lower or 'circuit' in section_lower or 'panel' in section_lower:
-        return 'ELECTRICAL'
-    
-    elif 'hvac' in section_lower or 'hvac' in component_lower or 'heating' in section_lower or 'cooling' in section_lower or 'air condition' in section_lower or 'furnace' in section_lower:
-        return 'HVAC'
-    
-    elif 'window' in section_lower or 'window' in component_lower or 'door' in section_lower or 'door' in component_lower:
-        return 'WINDOWS/DOORS'
-    
-    elif 'appliance' in section_lower or 'appliance' in component_lower or 'dishwasher' in section_lower or 'disposal' in section_lower or 'range' in section_lower:
-        return 'MISCELLANEOUS'
-    
-    # Check component for more specific categorization
-    elif 'grading' in component_lower or 'soil' in component_lower:
-        return 'FOUNDATION'  # Grading/soil issues are foundation work
-    
-    elif 'wood rot' in component_lower or 'wood trim' in component_lower or 'siding' in component_lower or 'decks' in component_lower or 'porches' in component_lower:
-        return 'MISCELLANEOUS'  # Exterior wood work - miscellaneous repairs
-    
-    # Structural Systems is tricky - need to look at description
-    elif 'structural' in section_lower:
-        # This could be foundation, roof, or walls
-        return 'FOUNDATION'  # Default for structural
-    
-    else:
-        return 'MISCELLANEOUS'
+    section_lower = section.lower()
+    component_lower = component.lower()
+
+    for category, section_pattern, component_pattern in _EXTRACTION_CATEGORY_PATTERNS:
+        if section_pattern is not None and section_pattern.search(section_lower):
+            return category
+        if component_pattern is not None and component_pattern.search(component_lower):
+            return category
+
+    return 'MISCELLANEOUS'
 
 
-def create_fallback_pricing(issue: Dict[str, Any]) -> Dict[str, Any]:
+class PricedItem(TypedDict, total=False):
+    """
+    Shape of a priced or consolidated line item.
+
+    Items stay plain dicts: they round-trip through Gemini responses, the
+    pricing cache and the PDF generator, and may carry extra keys.
+    """
+
+    category: str
+    description: str
+    qty: int
+    unit_price_usd: float
+    line_total_usd: float
+    notes: str
+    disclaimer: str
+    priority: str
+    bundled_issues: int
+    discount_applied: int
+    discount_justification: str
+    original_issue_id: int
+    original_issue: Dict[str, Any]
+    original_items: List[PricedItem]
+
+
+def create_fallback_pricing(issue: Dict[str, Any]) -> PricedItem:
     """
     Create fallback pricing when Gemini fails to price an issue.
     Uses severity-based pricing from CATEGORY_SEVERITY_PRICE_MATRIX.
@@ -1335,8 +1602,8 @@ def create_fallback_pricing(issue: Dict[str, Any]) -> Dict[str, Any]:
     severity_prices = CATEGORY_SEVERITY_PRICE_MATRIX.get(category, CATEGORY_SEVERITY_PRICE_MATRIX["MISCELLANEOUS"])
     base_price = severity_prices.get(severity, severity_prices.get("moderate", 200))
 
-    # Add some randomness to avoid all fallbacks having same price
-    price = base_price * random.uniform(0.9, 1.1)
+    # Add some randomness (uniform ±10%) to avoid all fallbacks having same price
+    price = base_price * (0.9 + 0.2 * random.random())
     price = round(price / 25) * 25  # Round to nearest $25
 
     return {
@@ -1353,10 +1620,52 @@ def create_fallback_pricing(issue: Dict[str, Any]) -> Dict[str, Any]:
     }
 
 
+def _pack_bundles(issue_counts: List[int], max_per_bundle: int) -> List[Tuple[int, int]]:
+    """
+    Greedily split consecutive items into bundles of at most max_per_bundle issues.
+
+    Args:
+        issue_counts: Number of issues carried by each item, in order
+        max_per_bundle: Maximum issues per bundle
+
+    Returns:
+        List of (start, end) slice bounds, one per bundle. An item that alone
+        exceeds the limit still gets a bundle of its own.
+    """
+    n = len(issue_counts)
+    if max_per_bundle >= 1 and set(issue_counts) == {1}:
+        # Individually priced items carry one issue each, so the greedy
+        # split is just fixed-size chunks
+        return [(start, min(start + max_per_bundle, n)) for start in range(0, n, max_per_bundle)]
+
+    bounds = []
+    start = 0
+    running = 0
+
+    for idx, count in enumerate(issue_counts):
+        # Close the current bundle if adding this item would exceed max
+        if running + count > max_per_bundle and idx > start:
+            bounds.append((start, idx))
+            start = idx
+            running = count
+        else:
+            running += count
+
+    # Don't forget the last bundle
+    if start < n:
+        bounds.append((start, n))
+
+    return bounds
+
+
+def _item_category(item: PricedItem) -> str:
+    return item.get("category", "MISCELLANEOUS")
+
+
 def code_based_consolidation(
-    priced_items: List[Dict[str, Any]],
+    priced_items: List[PricedItem],
     normalized_issues: List[Dict[str, Any]]
-) -> List[Dict[str, Any]]:
+) -> List[PricedItem]:
     """
     TWO-PHASE APPROACH - Phase 2: Code-based consolidation with hard limits.
 
@@ -1366,22 +1675,22 @@ def code_based_consolidation(
     This is what code is good at: counting, arithmetic, enforcing hard limits.
     """
     LOGGER.info(f"🔧 PHASE 2: Consolidating {len(priced_items)} priced items...")
+    LOGGER.debug(f"Category mapping cache: {map_extraction_category_to_pricing.cache_info()}")
 
-    # Group items by category
-    by_category = {}
+    # Walk items grouped by category, categories in first-seen order (the
+    # stable sort keeps each category's original item order)
+    first_seen: Dict[str, int] = {}
     for item in priced_items:
-        cat = item.get("category", "MISCELLANEOUS")
-        if cat not in by_category:
-            by_category[cat] = []
-        by_category[cat].append(item)
+        first_seen.setdefault(_item_category(item), len(first_seen))
+    sorted_items = sorted(priced_items, key=lambda item: first_seen[_item_category(item)])
 
     consolidated_items = []
 
-    for category, cat_items in by_category.items():
+    for category, group in itertools.groupby(sorted_items, key=_item_category):
+        cat_items = list(group)
         # Get category-specific rules
-        rules = CATEGORY_CONSOLIDATION_RULES.get(category, CATEGORY_CONSOLIDATION_RULES["MISCELLANEOUS"])
-        max_issues_per_item = rules["max_per_item"]
-        target_ratio = rules["target_ratio"]
+        profile = _category_profile(category)
+        max_issues_per_item = profile.max_per_item
 
         LOGGER.info(f"  {category}: {len(cat_items)} items (max {max_issues_per_item} per bundle)")
 
@@ -1391,47 +1700,41 @@ def code_based_consolidation(
             LOGGER.info(f"    ✅ 1 item kept as-is")
         else:
             # Multiple items - consolidate with hard limits
-            # Strategy: Greedily bundle items until we hit max_issues_per_item
-            current_bundle = []
-            current_count = 0
-            bundle_num = 1
-
-            for item in cat_items:
-                # Each item represents 1 issue (from individual pricing)
-                item_count = item.get("bundled_issues", 1)
-
-                # Check if adding this item would exceed max
-                if current_count + item_count > max_issues_per_item and current_bundle:
-                    # Create consolidated line item from current bundle
-                    consolidated_item = create_consolidated_line_item(
-                        current_bundle, category, bundle_num
-                    )
-                    consolidated_items.append(consolidated_item)
-
-                    # Start new bundle
-                    current_bundle = [item]
-                    current_count = item_count
-                    bundle_num += 1
-                else:
-                    # Add to current bundle
-                    current_bundle.append(item)
-                    current_count += item_count
-
-            # Don't forget the last bundle
-            if current_bundle:
+            # Each item represents 1 issue (from individual pricing)
+            bounds = _pack_bundles(
+                [item.get("bundled_issues", 1) for item in cat_items],
+                max_issues_per_item
+            )
+
+            for bundle_num, (start, end) in enumerate(bounds, 1):
                 consolidated_item = create_consolidated_line_item(
-                    current_bundle, category, bundle_num
+                    cat_items[start:end], category, bundle_num, profile
                 )
                 consolidated_items.append(consolidated_item)
 
-            LOGGER.info(f"    ✅ {len(cat_items)} items → {bundle_num} bundles (max {max_issues_per_item} issues/bundle)")
+            LOGGER.info(f"    ✅ {len(cat_items)} items → {len(bounds)} bundles (max {max_issues_per_item} issues/bundle)")
 
     LOGGER.info(f"✅ PHASE 2 COMPLETE: {len(priced_items)} items → {len(consolidated_items)} consolidated items")
 
     return consolidated_items
 
 
-def _create_meaningful_description(items: List[Dict[str, Any]], category: str) -> str:
+def _extract_theme(item: PricedItem) -> str:
+    """Return the key words of an item's title (before a colon, else its first three words)."""
+    if "original_issue" in item:
+        title = item["original_issue"].get("title", "")
+    else:
+        title = item.get("description", "")
+
+    if not title:
+        return ""
+
+    if ":" in title:
+        return title.partition(":")[0].strip()
+    return " ".join(title.split()[:3])
+
+
+def _create_meaningful_description(items: List[PricedItem], category: str) -> str:
     """
     Create a meaningful description based on the actual issues in the items.
 
@@ -1447,36 +1750,19 @@ def _create_meaningful_description(items: List[Dict[str, Any]], category: str) -
                 return title
         return item.get("description", f"{category.title()} Repairs")
 
-    # Multiple items - extract key themes from issue titles
-    themes = []
-    seen_keywords = set()
-
+    # Multiple items - extract key themes from issue titles, keyed by
+    # lowercase so the first spelling of each theme wins
+    seen_themes: Dict[str, str] = {}
     for item in items:
-        if "original_issue" in item:
-            title = item["original_issue"].get("title", "")
-        else:
-            title = item.get("description", "")
-
-        if not title:
+        key_part = _extract_theme(item)
+        if len(key_part) <= 3:
             continue
-
-        # Extract key words from title (before colon if present)
-        if ":" in title:
-            key_part = title.split(":")[0].strip()
-        else:
-            # Take first few words
-            words = title.split()[:3]
-            key_part = " ".join(words)
-
-        # Normalize and check if we've seen this theme
-        key_normalized = key_part.lower()
-        if key_normalized not in seen_keywords and len(key_part) > 3:
-            themes.append(key_part)
-            seen_keywords.add(key_normalized)
+        seen_themes.setdefault(key_part.lower(), key_part)
 
         # Limit to 3 themes for readability
-        if len(themes) >= 3:
+        if len(seen_themes) >= 3:
             break
+    themes = list(seen_themes.values())
 
     if themes:
         if len(themes) == 1:
@@ -1491,7 +1777,56 @@ def _create_meaningful_description(items: List[Dict[str, Any]], category: str) -
     return f"{category.title()} Repairs"
 
 
-def _create_detailed_notes_from_items(items: List[Dict[str, Any]]) -> str:
+# Placeholder notes text that carries no useful detail for consolidated notes
+_FALLBACK_NOTES_TEXT = "Fallback pricing based on deficient severity"
+_MAX_DETAIL_LENGTH = 200
+
+
+def _extract_item_detail(item: PricedItem) -> str:
+    """
+    Extract the one-line detail for an item in consolidated notes.
+
+    Returns an empty string when the item has nothing useful to show.
+    """
+    detail_text = ""
+
+    # Priority 1: Get from original_issue (most detailed and accurate)
+    original = item.get("original_issue") or {}
+    if original:
+        title = original.get("title", "")
+
+        # Use title as the primary detail
+        if title:
+            detail_text = title
+            # Add location if available and not already in title
+            location = original.get("location", "")
+            if location and location.lower() not in title.lower():
+                detail_text = f"{title} ({location})"
+        else:
+            # If no title, use description but keep it concise
+            detail_text = original.get("description", "")
+
+    # Priority 2: Use item's description if no original_issue
+    if not detail_text:
+        detail_text = item.get("description", "")
+
+    # Priority 3: Use item's notes as last resort
+    if not detail_text or detail_text == _FALLBACK_NOTES_TEXT:
+        detail_text = item.get("notes", "")
+
+    # Clean up and remove recommendation text to keep it concise
+    detail_text = detail_text.partition("Recommendation:")[0].strip()
+
+    # Truncate if too long (but allow more space for readability)
+    if len(detail_text) > _MAX_DETAIL_LENGTH:
+        detail_text = detail_text[:_MAX_DETAIL_LENGTH - 3] + "..."
+
+    if detail_text == _FALLBACK_NOTES_TEXT:
+        return ""
+    return detail_text
+
+
+def _create_detailed_notes_from_items(items: List[PricedItem]) -> str:
     """
     Create detailed notes from a list of items being consolidated.
 
@@ -1519,49 +1854,13 @@ def _create_detailed_notes_from_items(items: List[Dict[str, Any]]) -> str:
         # Fallback to item's own description or notes
         return item.get("description", item.get("notes", ""))
 
-    # Multiple items - create a detailed numbered list
-    details = []
-    for i, item in enumerate(items, 1):
-        detail_text = ""
-
-        # Priority 1: Get from original_issue (most detailed and accurate)
-        if "original_issue" in item:
-            original = item["original_issue"]
-            title = original.get("title", "")
-            desc = original.get("description", "")
-            location = original.get("location", "")
-
-            # Use title as the primary detail
-            if title:
-                detail_text = title
-                # Add location if available and not already in title
-                if location and location.lower() not in title.lower():
-                    detail_text = f"{title} ({location})"
-            elif desc:
-                # If no title, use description but keep it concise
-                detail_text = desc
-
-        # Priority 2: Use item's description if no original_issue
-        if not detail_text:
-            detail_text = item.get("description", "")
-
-        # Priority 3: Use item's notes as last resort
-        if not detail_text or detail_text == "Fallback pricing based on deficient severity":
-            detail_text = item.get("notes", "")
-
-        # Clean up and format
-        detail_text = detail_text.strip()
-
-        # Remove recommendation text to keep it concise
-        if "Recommendation:" in detail_text:
-            detail_text = detail_text.split("Recommendation:")[0].strip()
-
-        # Truncate if too long (but allow more space for readability)
-        if len(detail_text) > 200:
-            detail_text = detail_text[:197] + "..."
-
-        if detail_text and detail_text != "Fallback pricing based on deficient severity":
-            details.append(f"{i}. {detail_text}")
+    # Multiple items - create a detailed numbered list (numbering keeps each
+    # item's position even when an item contributes no detail)
+    details = [
+        f"{i}. {detail_text}"
+        for i, detail_text in enumerate(map(_extract_item_detail, items), 1)
+        if detail_text
+    ]
 
     if not details:
         return f"Includes {len(items)} related repairs"
@@ -1570,24 +1869,44 @@ def _create_detailed_notes_from_items(items: List[Dict[str, Any]]) -> str:
     return "\n".join(details)
 
 
+# Priority ordering for consolidated items (lower rank = more urgent)
+_PRIORITY_RANK = {"CRITICAL": 0, "HIGH": 1, "MEDIUM": 2, "LOW": 3}
+
+
 def create_consolidated_line_item(
-    items: List[Dict[str, Any]],
+    items: List[PricedItem],
     category: str,
-    bundle_num: int
-) -> Dict[str, Any]:
+    bundle_num: int,
+    profile: Optional[_CategoryProfile] = None
+) -> PricedItem:
     """
     Create a consolidated line item from multiple priced items.
 
-    Applies bundling discount and creates a clear description.
+    Applies bundling discount and creates a clear description. Callers that
+    build several bundles per category can pass the resolved profile.
     """
-    # Sum up prices
-    total_price = sum(item.get("unit_price_usd", 0) for item in items)
+    if profile is None:
+        profile = _category_profile(category)
+    bundle_size = len(items)
+
+    # Sum up prices and pick the highest priority in one pass
+    # (unknown priorities rank as MEDIUM; ties keep the first item's value)
+    total_price = 0
+    priority = None
+    best_rank = len(_PRIORITY_RANK)
+    for item in items:
+        total_price += item.get("unit_price_usd", 0)
+        item_priority = item.get("priority", "MEDIUM")
+        rank = _PRIORITY_RANK.get(item_priority, _PRIORITY_RANK["MEDIUM"])
+        if rank < best_rank:
+            best_rank = rank
+            priority = item_priority
 
     # Apply bundling discount (5-10% for same category, same location efficiency)
     discount_pct = 0
-    if len(items) >= 3:
+    if bundle_size >= 3:
         discount_pct = 10  # 10% for 3+ items
-    elif len(items) == 2:
+    elif bundle_size == 2:
         discount_pct = 5   # 5% for 2 items
 
     discounted_price = total_price * (1 - discount_pct / 100)
@@ -1596,28 +1915,23 @@ def create_consolidated_line_item(
     # Create meaningful description based on actual issues
     description = _create_meaningful_description(items, category)
 
-    # Get highest priority
-    priorities = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
-    item_priorities = [item.get("priority", "MEDIUM") for item in items]
-    priority = min(item_priorities, key=lambda p: priorities.index(p) if p in priorities else 2)
-
     # Create detailed notes from original items
     detailed_notes = _create_detailed_notes_from_items(items)
 
     # Create consolidated item
-    consolidated = {
+    consolidated: PricedItem = {
         "category": category,
         "description": description,
         "qty": 1,
         "unit_price_usd": discounted_price,
         "line_total_usd": discounted_price,
         "notes": detailed_notes,
-        "disclaimer": DISCLAIMER_TEMPLATES.get(category, ""),
+        "disclaimer": profile.disclaimer,
         "priority": priority,
-        "bundled_issues": len(items),
+        "bundled_issues": bundle_size,
         "discount_applied": discount_pct,
-        "discount_justification": f"Same category, {len(items)} items bundled for efficiency" if discount_pct > 0 else "No discount",
-        "original_items": items  # Keep reference to original items for transparency
+        "discount_justification": f"Same category, {bundle_size} items bundled for efficiency" if discount_pct > 0 else "No discount",
+        "original_items": items  # Keep reference to original items for transparency (caller passes a fresh slice)
     }
 
     return consolidated
@@ -1647,40 +1961,45 @@ def enforce_consolidation_limits(items: List[Dict[str, Any]], all_issues: List[D
             continue
 
         # Get rules for this category
-        rules = CATEGORY_CONSOLIDATION_RULES.get(category, CATEGORY_CONSOLIDATION_RULES["MISCELLANEOUS"])
-        max_per_item = rules["max_per_item"]
+        max_per_item = _category_profile(category).max_per_item
 
         # Check if this item violates the max limit
         if issue_count > max_per_item and bundled_issues:  # Only split if we have the actual issues list
             LOGGER.warning(f"🔧 AUTO-FIX: {category} item has {issue_count} issues (max {max_per_item}). Splitting...")
 
-            # Split into multiple items
+            # Split into multiple items of near-equal size
             num_splits = math.ceil(issue_count / max_per_item)
             issues_per_split = math.ceil(issue_count / num_splits)
-
-            for i in range(num_splits):
-                start_idx = i * issues_per_split
-                end_idx = min((i + 1) * issues_per_split, issue_count)
-                split_issues = bundled_issues[start_idx:end_idx]
-
-                if not split_issues:
-                    continue
-
-                # Create new item with split issues
-                split_item = {
+            chunks = [
+                bundled_issues[start:start + issues_per_split]
+                for start in range(0, issue_count, issues_per_split)
+            ]
+
+            # Fields shared by every part; prices are distributed evenly
+            description = item.get('description', category + ' repairs')
+            base_price = item.get("base_price", 0) / num_splits
+            final_price = item.get("final_price", 0) / num_splits
+            line_total = item.get("line_total_usd", 0) / num_splits
+            discount_applied = item.get("discount_applied", 0)
+            discount_justification = item.get("discount_justification", "")
+            priority = item.get("priority", "MEDIUM")
+            notes = f"Auto-split from over-consolidated item ({issue_count} issues > {max_per_item} max)"
+
+            fixed_items.extend(
+                {
                     "category": category,
-                    "description": f"{item.get('description', category + ' repairs')} - Part {i+1} of {num_splits}",
+                    "description": f"{description} - Part {part} of {num_splits}",
                     "bundled_issues": split_issues,
-                    "base_price": item.get("base_price", 0) / num_splits,  # Distribute price evenly
-                    "discount_applied": item.get("discount_applied", 0),
-                    "discount_justification": item.get("discount_justification", ""),
-                    "final_price": item.get("final_price", 0) / num_splits,
-                    "line_total_usd": item.get("line_total_usd", 0) / num_splits,
-                    "priority": item.get("priority", "MEDIUM"),
-                    "notes": f"Auto-split from over-consolidated item ({issue_count} issues > {max_per_item} max)",
+                    "base_price": base_price,
+                    "discount_applied": discount_applied,
+                    "discount_justification": discount_justification,
+                    "final_price": final_price,
+                    "line_total_usd": line_total,
+                    "priority": priority,
+                    "notes": notes,
                 }
-
-                fixed_items.append(split_item)
+                for part, split_issues in enumerate(chunks, 1)
+            )
 
             LOGGER.info(f"✅ Split {category} item into {num_splits} items ({issues_per_split} issues each)")
         else:
@@ -1692,6 +2011,170 @@ def enforce_consolidation_limits(items: List[Dict[str, Any]], all_issues: List[D
     return fixed_items
 
 
+# Patterns for pulling JSON out of Gemini responses
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(\{.*\})\s*```', re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r'(\{.*\})', re.DOTALL)
+_JSON_OBJECT_OR_ARRAY_RE = re.compile(r'(\{.*\}|\[.*\])', re.DOTALL)
+# Broken separators between array objects, e.g. }e{ or }{ (should be },{)
+_BROKEN_LETTER_SEPARATOR_RE = re.compile(r'\}\s*([a-z])\s*\{', re.IGNORECASE)
+_BROKEN_SEPARATOR_RE = re.compile(r'\}\s*\{')
+
+
+def _stable_hash_issues(issues: List[Dict[str, Any]], version: str) -> str:
+    """
+    Short cache key for a list of issues plus a prompt version.
+
+    Hashes the same bytes as json.dumps(issues, sort_keys=True) + version,
+    one issue at a time, so the full document is never built in memory.
+    """
+    digest = hashlib.sha256(b"[")
+    for idx, issue in enumerate(issues):
+        if idx:
+            digest.update(b", ")
+        digest.update(json.dumps(issue, sort_keys=True).encode())
+    digest.update(b"]")
+    digest.update(version.encode())
+    return digest.hexdigest()[:16]
+
+
+# Bump to invalidate cached phase-1 pricing when the individual prompt changes
+_INDIVIDUAL_PROMPT_VERSION = "v7.1-individual-pricing"
+
+# Batch job states after which polling stops
+_BATCH_TERMINAL_STATES = {
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+}
+
+
+def _individual_pricing_cache_path(normalized_issues: List[Dict[str, Any]]) -> Tuple[str, Path]:
+    """Cache key and file for phase-1 pricing (shared by sync and batch modes)."""
+    # Create cache key from issues content AND prompt version
+    cache_key = _stable_hash_issues(normalized_issues, _INDIVIDUAL_PROMPT_VERSION)
+    return cache_key, Path(".estimate_cache") / f"{cache_key}.json"
+
+
+def _individual_pricing_config() -> Dict[str, Any]:
+    """Generation config for phase-1 requests."""
+    if not config:
+        raise RuntimeError("config module is required for deterministic pricing")
+
+    from config import GEMINI_GENERATION_CONFIG
+
+    # Build config dict with response_mime_type and generation settings
+    return {
+        "response_mime_type": "application/json",
+        **GEMINI_GENERATION_CONFIG
+    }
+
+
+def _individual_pricing_contents(issue: Dict[str, Any], pricebook: Dict[str, Any]) -> List[Dict[str, Any]]:
+    prompt = create_individual_pricing_prompt(issue, pricebook)
+    return [{"role": "user", "parts": [{"text": prompt}]}]
+
+
+def _priced_item_from_response(response: Any, issue: Dict[str, Any], idx: int) -> Tuple[PricedItem, bool]:
+    """
+    Turn a Gemini response for one issue into a priced item.
+
+    Unparseable JSON falls back to severity-based pricing, reported by the
+    returned flag; a response with no text at all raises (extract_text).
+    """
+    # Implicit prefix caching is reported in usage metadata
+    cached_tokens = getattr(getattr(response, "usage_metadata", None), "cached_content_token_count", None)
+    if cached_tokens:
+        LOGGER.debug(f"    Issue {idx}: {cached_tokens} prompt tokens served from cache")
+
+    # Extract text from response
+    result_text = extract_text(response)
+
+    # Try to extract JSON from markdown code blocks if present
+    json_match = _JSON_FENCE_RE.search(result_text) if "```" in result_text else None
+    if json_match:
+        result_text = json_match.group(1)
+    else:
+        # Try to find JSON object in the text
+        json_match = _JSON_OBJECT_RE.search(result_text)
+        if json_match:
+            result_text = json_match.group(0)
+
+    # Parse JSON
+    fell_back = False
+    try:
+        item = _loads_json(result_text)
+    except json.JSONDecodeError as json_err:
+        LOGGER.error(f"Failed to parse JSON for issue {idx}: {json_err}")
+        LOGGER.error(f"Response text (first 500 chars): {result_text[:500]}")
+        # Fallback: use severity-based pricing
+        item = create_fallback_pricing(issue)
+        fell_back = True
+
+    # Ensure required fields
+    item['bundled_issues'] = 1  # Individual pricing - always 1
+    item['original_issue_id'] = idx - 1  # Track which issue this came from
+    item['original_issue'] = issue  # Keep reference to original issue
+    return item, fell_back
+
+
+def _fallback_priced_item(issue: Dict[str, Any], idx: int) -> PricedItem:
+    # Fallback: use severity-based pricing
+    item = create_fallback_pricing(issue)
+    item['original_issue_id'] = idx - 1
+    item['original_issue'] = issue
+    return item
+
+
+def _is_rate_limit_error(exc: Exception) -> bool:
+    """True for Gemini quota errors (HTTP 429 / RESOURCE_EXHAUSTED)."""
+    return getattr(exc, "code", None) == 429 or getattr(exc, "status", None) == "RESOURCE_EXHAUSTED"
+
+
+def _price_single_issue(
+    client: genai.Client,
+    model_name: str,
+    config_dict: Dict[str, Any],
+    pricebook: Dict[str, Any],
+    idx: int,
+    issue_count: int,
+    issue: Dict[str, Any],
+) -> Tuple[PricedItem, bool]:
+    """
+    Price one issue with Gemini, falling back to severity-based pricing.
+
+    Rate-limit errors are retried with exponential backoff (PRICING_CONFIG)
+    before giving up. idx is 1-based; the returned item records it as
+    original_issue_id (0-based). The flag is True when the request or its
+    JSON failed and the item carries fallback pricing.
+    """
+    from config import PRICING_CONFIG
+
+    LOGGER.info(f"  Pricing issue {idx}/{issue_count}: {issue.get('description', 'N/A')[:60]}...")
+
+    contents = _individual_pricing_contents(issue, pricebook)
+    delay = PRICING_CONFIG["rate_limit_backoff_seconds"]
+    for attempt in range(PRICING_CONFIG["rate_limit_retries"] + 1):
+        try:
+            response = client.models.generate_content(
+                model=normalize_model_name(model_name),
+                contents=contents,
+                config=config_dict,
+            )
+            return _priced_item_from_response(response, issue, idx)
+        except Exception as e:
+            if _is_rate_limit_error(e) and attempt < PRICING_CONFIG["rate_limit_retries"]:
+                # Jitter so concurrent workers don't retry in lockstep
+                wait = delay * (0.5 + random.random())
+                LOGGER.warning(f"Rate limited pricing issue {idx}, retrying in {wait:.1f}s")
+                time.sleep(wait)
+                delay = min(delay * 2, PRICING_CONFIG["rate_limit_backoff_max_seconds"])
+                continue
+            LOGGER.error(f"Error pricing issue {idx}: {e}")
+            return _fallback_priced_item(issue, idx), True
+
+
 def call_gemini_for_individual_pricing(
     client: genai.Client,
     model_name: str,
@@ -1704,99 +2187,130 @@ def call_gemini_for_individual_pricing(
     This function prices each issue separately using Gemini, then returns
     the priced issues for code-based consolidation in Phase 2.
     """
-    if not config:
-        raise RuntimeError("config module is required for deterministic pricing")
-
-    from config import GEMINI_GENERATION_CONFIG
-
-    # Create cache key from issues content AND prompt version
-    prompt_version = "v7.0-individual-pricing"
-    cache_key = hashlib.sha256(
-        (json.dumps(normalized_issues, sort_keys=True) + prompt_version).encode()
-    ).hexdigest()[:16]
+    config_dict = _individual_pricing_config()
+    from config import PRICING_CONFIG
 
     # Check cache first
-    cache_dir = Path(".estimate_cache")
-    cache_path = cache_dir / f"{cache_key}.json"
-
-    if cache_path.exists():
+    cache_key, cache_path = _individual_pricing_cache_path(normalized_issues)
+    cached = _read_cache_file(cache_path)
+    if cached is not None:
         LOGGER.info(f"Using cached individual pricing for {cache_key}")
-        with open(cache_path, 'r') as f:
-            cached = json.load(f)
-            return cached["items"], cached.get("tokens")
+        return cached["items"], cached.get("tokens")
 
     LOGGER.info(f"🔧 PHASE 1: Pricing {len(normalized_issues)} issues individually...")
 
-    priced_items = []
+    issue_count = len(normalized_issues)
+
+    def price_issue(idx: int, issue: Dict[str, Any]) -> Tuple[PricedItem, bool]:
+        return _price_single_issue(
+            client, model_name, config_dict, pricebook, idx, issue_count, issue
+        )
+
     total_tokens = 0
 
-    # Price each issue individually
-    for idx, issue in enumerate(normalized_issues, 1):
-        LOGGER.info(f"  Pricing issue {idx}/{len(normalized_issues)}: {issue.get('description', 'N/A')[:60]}...")
+    # Price each issue individually. The calls are network-bound, so run a
+    # bounded number of them concurrently; map() keeps results in issue order.
+    max_workers = max(1, min(PRICING_CONFIG["max_concurrent_requests"], issue_count))
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pricing") as executor:
+        results = list(executor.map(price_issue, range(1, issue_count + 1), normalized_issues))
+    priced_items = [item for item, _ in results]
+    failed = sum(1 for _, fell_back in results if fell_back)
 
-        # Build individual pricing prompt
-        prompt = create_individual_pricing_prompt(issue, pricebook)
+    LOGGER.info(f"✅ PHASE 1 COMPLETE: Priced {len(priced_items)} issues individually")
+    LOGGER.debug(f"Individual prompt cache: {_render_individual_prompt.cache_info()}")
 
-        contents = [{"role": "user", "parts": [{"text": prompt}]}]
+    # Save to cache, unless some requests failed: a re-run should retry them
+    # rather than reuse their randomized fallback prices.
+    if failed:
+        LOGGER.warning(f"{failed} issue(s) used fallback pricing; not caching this run")
+    else:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_cache_file(cache_path, {"items": priced_items, "tokens": total_tokens})
 
-        try:
-            # Build config dict with response_mime_type and generation settings
-            config_dict = {
-                "response_mime_type": "application/json",
-                **GEMINI_GENERATION_CONFIG
-            }
+    return priced_items, total_tokens
 
-            response = client.models.generate_content(
-                model=normalize_model_name(model_name),
-                contents=contents,
-                config=config_dict,
-            )
 
-            # Extract text from response
-            result_text = extract_text(response)
+def call_gemini_for_individual_pricing_batch(
+    client: genai.Client,
+    model_name: str,
+    normalized_issues: List[Dict[str, Any]],
+    pricebook: Dict[str, Any],
+) -> Tuple[List[Dict[str, Any]], Optional[int]]:
+    """
+    Phase 1 through the Gemini Batch API.
 
-            # Try to extract JSON from markdown code blocks if present
-            json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', result_text, re.DOTALL)
-            if json_match:
-                result_text = json_match.group(1)
-            else:
-                # Try to find JSON object in the text
-                json_match = re.search(r'(\{.*\})', result_text, re.DOTALL)
-                if json_match:
-                    result_text = json_match.group(0)
-
-            # Parse JSON
-            try:
-                item = json.loads(result_text)
-            except json.JSONDecodeError as json_err:
-                LOGGER.error(f"Failed to parse JSON for issue {idx}: {json_err}")
-                LOGGER.error(f"Response text (first 500 chars): {result_text[:500]}")
-                # Fallback: use severity-based pricing
-                item = create_fallback_pricing(issue)
+    Submits every issue prompt as one batch job (inline requests), polls
+    until the job finishes and maps the responses back in issue order.
+    Batch requests are billed at a discount but may take minutes to hours,
+    so this suits offline regeneration rather than interactive runs. Results
+    share the synchronous path's cache.
+    """
+    config_dict = _individual_pricing_config()
+    from config import PRICING_CONFIG
 
-            # Ensure required fields
-            item['bundled_issues'] = 1  # Individual pricing - always 1
-            item['original_issue_id'] = idx - 1  # Track which issue this came from
-            item['original_issue'] = issue  # Keep reference to original issue
+    # Check cache first
+    cache_key, cache_path = _individual_pricing_cache_path(normalized_issues)
+    cached = _read_cache_file(cache_path)
+    if cached is not None:
+        LOGGER.info(f"Using cached individual pricing for {cache_key}")
+        return cached["items"], cached.get("tokens")
 
-            priced_items.append(item)
+    LOGGER.info(f"🔧 PHASE 1 (batch): Submitting {len(normalized_issues)} issues as one batch job...")
 
+    requests = [
+        {"contents": _individual_pricing_contents(issue, pricebook), "config": config_dict}
+        for issue in normalized_issues
+    ]
+    batch_job = client.batches.create(
+        model=normalize_model_name(model_name),
+        src=requests,
+        config={"display_name": f"estimate-pricing-{cache_key}"},
+    )
+    LOGGER.info(f"  Batch job {batch_job.name} created")
+
+    # Poll with exponential backoff until the job reaches a terminal state
+    delay = PRICING_CONFIG["batch_poll_initial_seconds"]
+    state = getattr(batch_job.state, "name", str(batch_job.state))
+    while state not in _BATCH_TERMINAL_STATES:
+        time.sleep(delay)
+        delay = min(delay * 2, PRICING_CONFIG["batch_poll_max_seconds"])
+        batch_job = client.batches.get(name=batch_job.name)
+        state = getattr(batch_job.state, "name", str(batch_job.state))
+        LOGGER.info(f"  Batch job {batch_job.name}: {state}")
+
+    responses = getattr(batch_job.dest, "inlined_responses", None) if batch_job.dest else None
+    if state not in ("JOB_STATE_SUCCEEDED", "JOB_STATE_PARTIALLY_SUCCEEDED") or not responses:
+        raise RuntimeError(f"Batch pricing job {batch_job.name} ended in {state}: {batch_job.error}")
+    if len(responses) != len(normalized_issues):
+        raise RuntimeError(
+            f"Batch pricing job {batch_job.name} returned {len(responses)} responses "
+            f"for {len(normalized_issues)} issues"
+        )
+
+    priced_items = []
+    failed = 0
+    for idx, (issue, inlined) in enumerate(zip(normalized_issues, responses), 1):
+        try:
+            if inlined.error or inlined.response is None:
+                raise ValueError(inlined.error or "no response")
+            item, fell_back = _priced_item_from_response(inlined.response, issue, idx)
         except Exception as e:
             LOGGER.error(f"Error pricing issue {idx}: {e}")
-            # Fallback: use severity-based pricing
-            item = create_fallback_pricing(issue)
-            item['original_issue_id'] = idx - 1
-            item['original_issue'] = issue
-            priced_items.append(item)
+            item, fell_back = _fallback_priced_item(issue, idx), True
+        priced_items.append(item)
+        failed += fell_back
 
-    LOGGER.info(f"✅ PHASE 1 COMPLETE: Priced {len(priced_items)} issues individually")
+    LOGGER.info(f"✅ PHASE 1 COMPLETE: Priced {len(priced_items)} issues in batch")
 
-    # Save to cache
-    cache_dir.mkdir(parents=True, exist_ok=True)
-    with open(cache_path, 'w') as f:
-        json.dump({"items": priced_items, "tokens": total_tokens}, f, indent=2)
+    # Save to cache, unless some requests failed (shared with the sync path,
+    # which would otherwise reuse the randomized fallback prices)
+    if failed:
+        LOGGER.warning(f"{failed} issue(s) used fallback pricing; not caching this run")
+    else:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        _write_cache_file(cache_path, {"items": priced_items, "tokens": 0})
 
-    return priced_items, total_tokens
+    return priced_items, 0
 
 
 def call_gemini_for_pricing(
@@ -1817,19 +2331,16 @@ def call_gemini_for_pricing(
     # Create cache key from issues content AND prompt version
     # Include prompt version to invalidate cache when we change consolidation rules
     prompt_version = "v6.0-aggressive-mandatory-limits"
-    cache_key = hashlib.sha256(
-        (json.dumps(normalized_issues, sort_keys=True) + prompt_version).encode()
-    ).hexdigest()[:16]
+    cache_key = _stable_hash_issues(normalized_issues, prompt_version)
 
     # Check cache first
     cache_dir = Path(".estimate_cache")
     cache_path = cache_dir / f"{cache_key}.json"
 
-    if cache_path.exists():
+    cached = _read_cache_file(cache_path)
+    if cached is not None:
         LOGGER.info(f"Using cached estimate for {cache_key}")
-        with open(cache_path, 'r') as f:
-            cached = json.load(f)
-            return cached["items"], cached.get("tokens")
+        return cached["items"], cached.get("tokens")
 
     # Build the enhanced prompt
     prompt = create_enhanced_pricing_prompt(normalized_issues, pricebook)
@@ -1853,22 +2364,22 @@ def call_gemini_for_pricing(
         result_text = extract_text(response)
         
         # Try to extract JSON from markdown code blocks if present
-        json_match = re.search(r'```(?:json)?\s*(\{.*\})\s*```', result_text, re.DOTALL)
+        json_match = _JSON_FENCE_RE.search(result_text) if "```" in result_text else None
         if json_match:
             result_text = json_match.group(1)
         else:
             # Try to find JSON object/array in the text
-            json_match = re.search(r'(\{.*\}|\[.*\])', result_text, re.DOTALL)
+            json_match = _JSON_OBJECT_OR_ARRAY_RE.search(result_text)
             if json_match:
                 result_text = json_match.group(0)
         
         # Clean up common Gemini JSON errors (e.g., }e{ → },{ or }{ → },{)
-        result_text = re.sub(r'\}\s*([a-z])\s*\{', r'},{', result_text, flags=re.IGNORECASE)
-        result_text = re.sub(r'\}\s*\{', r'},{', result_text)
+        result_text = _BROKEN_LETTER_SEPARATOR_RE.sub(r'},{', result_text)
+        result_text = _BROKEN_SEPARATOR_RE.sub(r'},{', result_text)
         
         # Parse JSON
         try:
-            result = json.loads(result_text)
+            result = _loads_json(result_text)
         except json.JSONDecodeError as json_err:
             # Save the raw response for debugging
             debug_file = cache_dir / f"{cache_key}_debug_response.txt"
@@ -1901,20 +2412,17 @@ def call_gemini_for_pricing(
         # Ensure new fields exist for transparency and backward compatibility
         for item in items:
             # Track how many issues were consolidated into this item
-            if 'bundled_issues' not in item:
-                item['bundled_issues'] = item.get('bundled_issues', 1)
+            item.setdefault('bundled_issues', 1)
 
             # Percentage discount applied for justified bundling
-            if 'discount_applied' not in item:
-                item['discount_applied'] = item.get('discount_applied', 0)
+            discount = item.setdefault('discount_applied', 0)
 
             # Reason for any discount
-            if 'discount_justification' not in item:
-                item['discount_justification'] = item.get('discount_justification', 'No discount')
+            item.setdefault('discount_justification', 'No discount')
 
             # Log discount information for transparency
             try:
-                if float(item.get('discount_applied', 0)) > 0:
+                if discount and float(discount) > 0:
                     LOGGER.info(
                         f"Discount applied: {item['discount_applied']}% on "
                         f"{item.get('description', 'item')[:50]} - "
@@ -1936,8 +2444,7 @@ def call_gemini_for_pricing(
 
         # Save to cache
         cache_dir.mkdir(parents=True, exist_ok=True)
-        with open(cache_path, 'w') as f:
-            json.dump({"items": items, "tokens": None}, f, indent=2)
+        _write_cache_file(cache_path, {"items": items, "tokens": None})
 
         return items, None
         
@@ -1949,51 +2456,58 @@ def call_gemini_for_pricing(
         raise
 
 
-def aggressive_consolidation(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Keyword bundling patterns for aggressive_consolidation
+_BUNDLING_PATTERNS = [
+    # Plumbing
+    {"category": "PLUMBING", "keywords": ["bathroom", "bath"], "name": "{location} plumbing repairs", "discount": 0.18},
+    {"category": "PLUMBING", "keywords": ["water heater", "TPR"], "name": "Water heater code compliance", "discount": 0.20},
+    {"category": "PLUMBING", "keywords": ["gas line", "drip leg"], "name": "Gas line code compliance", "discount": 0.15},
+
+    # Electrical
+    {"category": "ELECTRICAL", "keywords": ["panel", "breaker"], "name": "Electrical panel repairs", "discount": 0.18},
+    {"category": "ELECTRICAL", "keywords": ["outlet", "switch"], "name": "Branch circuit repairs", "discount": 0.20},
+    {"category": "ELECTRICAL", "keywords": ["GFCI", "detector"], "name": "Safety device installation package", "discount": 0.20},
+
+    # HVAC
+    {"category": "HVAC", "keywords": ["duct", "vent"], "name": "HVAC ductwork repairs", "discount": 0.15},
+    {"category": "HVAC", "keywords": ["coil", "refrigerant"], "name": "HVAC system service", "discount": 0.15},
+
+    # Roof/Foundation
+    {"category": "ROOF", "keywords": ["shingle", "flashing"], "name": "Roof repair package", "discount": 0.15},
+    {"category": "FOUNDATION", "keywords": ["crack", "settlement"], "name": "Foundation crack repair package", "discount": 0.15},
+
+    # Windows/Doors
+    {"category": "WINDOWS/DOORS", "keywords": ["door", "knob"], "name": "Door adjustments", "discount": 0.20},
+    {"category": "WINDOWS/DOORS", "keywords": ["window", "screen"], "name": "Window repairs", "discount": 0.20},
+]
+
+# Keywords of each bundling pattern compiled into one alternation. Matching
+# is against lowercased text, as before (so mixed-case keywords never match).
+_BUNDLING_PATTERN_RES = [_compile_keywords(tuple(pattern["keywords"])) for pattern in _BUNDLING_PATTERNS]
+
+
+def aggressive_consolidation(items: List[PricedItem]) -> List[PricedItem]:
     """
     Aggressively consolidate - TARGET: 15-18 final line items.
     """
     LOGGER.info(f"Starting consolidation with {len(items)} items")
     
-    # Define bundling patterns
-    patterns = [
-        # Plumbing
-        {"category": "PLUMBING", "keywords": ["bathroom", "bath"], "name": "{location} plumbing repairs", "discount": 0.18},
-        {"category": "PLUMBING", "keywords": ["water heater", "TPR"], "name": "Water heater code compliance", "discount": 0.20},
-        {"category": "PLUMBING", "keywords": ["gas line", "drip leg"], "name": "Gas line code compliance", "discount": 0.15},
-        
-        # Electrical
-        {"category": "ELECTRICAL", "keywords": ["panel", "breaker"], "name": "Electrical panel repairs", "discount": 0.18},
-        {"category": "ELECTRICAL", "keywords": ["outlet", "switch"], "name": "Branch circuit repairs", "discount": 0.20},
-        {"category": "ELECTRICAL", "keywords": ["GFCI", "detector"], "name": "Safety device installation package", "discount": 0.20},
-        
-        # HVAC
-        {"category": "HVAC", "keywords": ["duct", "vent"], "name": "HVAC ductwork repairs", "discount": 0.15},
-        {"category": "HVAC", "keywords": ["coil", "refrigerant"], "name": "HVAC system service", "discount": 0.15},
-        
-        # Roof/Foundation
-        {"category": "ROOF", "keywords": ["shingle", "flashing"], "name": "Roof repair package", "discount": 0.15},
-        {"category": "FOUNDATION", "keywords": ["crack", "settlement"], "name": "Foundation crack repair package", "discount": 0.15},
-        
-        # Windows/Doors
-        {"category": "WINDOWS/DOORS", "keywords": ["door", "knob"], "name": "Door adjustments", "discount": 0.20},
-        {"category": "WINDOWS/DOORS", "keywords": ["window", "screen"], "name": "Window repairs", "discount": 0.20},
-    ]
-    
+    # Bucket items by category once, with their lowercased search text
+    by_category: Dict[Any, List[Tuple[int, PricedItem, str]]] = {}
+    for i, item in enumerate(items):
+        desc = f"{item.get('description', '')} {item.get('notes', '')}".lower()
+        by_category.setdefault(item.get("category"), []).append((i, item, desc))
+
     consolidated = []
-    processed = set()
-    
-    # Apply each pattern
-    for pattern in patterns:
-        matching = []
-        for i, item in enumerate(items):
-            if i in processed:
-                continue
-            if item.get("category") != pattern["category"]:
-                continue
-            desc = f"{item.get('description', '')} {item.get('notes', '')}".lower()
-            if any(kw in desc for kw in pattern["keywords"]):
-                matching.append((i, item))
+    processed = bytearray(len(items))  # 1 once an item is bundled
+    
+    # Apply each pattern to its category's bucket only
+    for pattern, keyword_re in zip(_BUNDLING_PATTERNS, _BUNDLING_PATTERN_RES):
+        matching = [
+            (i, item)
+            for i, item, desc in by_category.get(pattern["category"], ())
+            if not processed[i] and keyword_re.search(desc)
+        ]
         
         # Bundle if multiple matches
         if len(matching) > 1:
@@ -2015,12 +2529,10 @@ def aggressive_consolidation(items: List[Dict[str, Any]]) -> List[Dict[str, Any]
             })
 
             for idx, _ in matching:
-                processed.add(idx)
+                processed[idx] = 1
     
     # Add unprocessed items
-    for i, item in enumerate(items):
-        if i not in processed:
-            consolidated.append(item)
+    consolidated.extend(item for item, done in zip(items, processed) if not done)
     
     LOGGER.info(f"Consolidated: {len(items)} → {len(consolidated)} items")
     
@@ -2031,25 +2543,40 @@ def aggressive_consolidation(items: List[Dict[str, Any]]) -> List[Dict[str, Any]
     return consolidated
 
 
-def force_category_consolidation(items: List[Dict[str, Any]], target: int = 18) -> List[Dict[str, Any]]:
+def _build_forced_package(package: List[PricedItem], category: str, disclaimer: str) -> PricedItem:
+    """Fuse one force-consolidation package into a line item (flat 12% bundle discount)."""
+    total = sum(i.get("unit_price_usd", 0) for i in package) * 0.88
+    price = round(total / 25) * 25
+
+    return {
+        "category": category,
+        "description": _create_meaningful_description(package, category),
+        "qty": 1,
+        "unit_price_usd": price,
+        "line_total_usd": price,
+        "notes": _create_detailed_notes_from_items(package),
+        "disclaimer": disclaimer,
+        "bundled_issues": sum(i.get("bundled_issues", 1) for i in package),
+        "original_items": package  # Keep reference for transparency
+    }
+
+
+def force_category_consolidation(items: List[PricedItem], target: int = 18) -> List[PricedItem]:
     """
     🔧 FIXED: Bundle by category while RESPECTING category-specific max ISSUES per line item.
 
     This function enforces CATEGORY_CONSOLIDATION_RULES by ensuring no line item
     bundles more than max_per_item ISSUES (not line items).
     """
-    by_cat = {}
+    by_cat: Dict[str, List[Dict[str, Any]]] = {}
     for item in items:
-        cat = item.get("category", "MISCELLANEOUS")
-        if cat not in by_cat:
-            by_cat[cat] = []
-        by_cat[cat].append(item)
+        by_cat.setdefault(item.get("category", "MISCELLANEOUS"), []).append(item)
 
     result = []
     for cat, cat_items in by_cat.items():
-        # Get category-specific rules
-        rules = CATEGORY_CONSOLIDATION_RULES.get(cat, CATEGORY_CONSOLIDATION_RULES["MISCELLANEOUS"])
-        max_issues_per_item = rules["max_per_item"]  # Max ISSUES per final line item
+        # Get category-specific rules (once per category)
+        profile = _category_profile(cat)
+        max_issues_per_item = profile.max_per_item  # Max ISSUES per final line item
 
         if len(cat_items) == 1:
             # Single item - keep as-is
@@ -2058,110 +2585,59 @@ def force_category_consolidation(items: List[Dict[str, Any]], target: int = 18)
         else:
             # Multiple items - bundle while respecting max_issues_per_item
             # Strategy: Greedily bundle items until we hit max_issues_per_item
-            current_package = []
-            current_issues_count = 0
-            package_num = 1
-
-            for item in cat_items:
-                item_issues = item.get("bundled_issues", 1)
-
-                # Check if adding this item would exceed max
-                if current_issues_count + item_issues > max_issues_per_item and current_package:
-                    # Create package from current items
-                    total = sum(i.get("unit_price_usd", 0) for i in current_package) * 0.88
-                    total_issues = sum(i.get("bundled_issues", 1) for i in current_package)
-
-                    # Create meaningful description and detailed notes
-                    meaningful_desc = _create_meaningful_description(current_package, cat)
-                    detailed_notes = _create_detailed_notes_from_items(current_package)
-
-                    result.append({
-                        "category": cat,
-                        "description": meaningful_desc,
-                        "qty": 1,
-                        "unit_price_usd": round(total / 25) * 25,
-                        "line_total_usd": round(total / 25) * 25,
-                        "notes": detailed_notes,
-                        "disclaimer": DISCLAIMER_TEMPLATES.get(cat, ""),
-                        "bundled_issues": total_issues,
-                        "original_items": current_package  # Keep reference for transparency
-                    })
-
-                    LOGGER.info(f"  {meaningful_desc}: {len(current_package)} items, {total_issues} issues (max {max_issues_per_item})")
-
-                    # Start new package
-                    current_package = [item]
-                    current_issues_count = item_issues
-                    package_num += 1
-                else:
-                    # Add to current package
-                    current_package.append(item)
-                    current_issues_count += item_issues
-
-            # Don't forget the last package
-            if current_package:
-                total = sum(i.get("unit_price_usd", 0) for i in current_package) * 0.88
-                total_issues = sum(i.get("bundled_issues", 1) for i in current_package)
-
-                # Create meaningful description and detailed notes
-                meaningful_desc = _create_meaningful_description(current_package, cat)
-                detailed_notes = _create_detailed_notes_from_items(current_package)
-
-                result.append({
-                    "category": cat,
-                    "description": meaningful_desc,
-                    "qty": 1,
-                    "unit_price_usd": round(total / 25) * 25,
-                    "line_total_usd": round(total / 25) * 25,
-                    "notes": detailed_notes,
-                    "disclaimer": DISCLAIMER_TEMPLATES.get(cat, ""),
-                    "bundled_issues": total_issues,
-                    "original_items": current_package  # Keep reference for transparency
-                })
-
-                LOGGER.info(f"  {meaningful_desc}: {len(current_package)} items, {total_issues} issues (max {max_issues_per_item})")
-
-            LOGGER.info(f"✅ {cat}: {len(cat_items)} items → {package_num} packages (respecting max {max_issues_per_item} issues/package)")
+            bounds = _pack_bundles(
+                [item.get("bundled_issues", 1) for item in cat_items],
+                max_issues_per_item
+            )
+
+            for start, end in bounds:
+                package = _build_forced_package(cat_items[start:end], cat, profile.disclaimer)
+                result.append(package)
+                LOGGER.info(
+                    f"  {package['description']}: {end - start} items, "
+                    f"{package['bundled_issues']} issues (max {max_issues_per_item})"
+                )
+
+            LOGGER.info(f"✅ {cat}: {len(cat_items)} items → {len(bounds)} packages (respecting max {max_issues_per_item} issues/package)")
 
     LOGGER.info(f"📊 Force consolidation: {len(items)} → {len(result)} items (respecting category max issue limits)")
 
     return result
 
 
-def stabilize_prices(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+# Contiguous price tiers used by stabilize_prices. Each price falls in the
+# tier its own value selects, so clamping only ever applies at the outer
+# bounds (below the minor floor or above the replacement ceiling).
+PRICE_RANGES = {
+    "minor": (75, 300),
+    "moderate": (300, 1000),
+    "major": (1000, 2500),
+    "replacement": (2500, 5000)
+}
+_PRICE_FLOOR = PRICE_RANGES["minor"][0]
+_PRICE_CEILING = PRICE_RANGES["replacement"][1]
+
+
+def _stabilize_item_price(item: PricedItem) -> None:
+    # Clamp price to the tier ranges
+    price = min(max(item.get("unit_price_usd", 0), _PRICE_FLOOR), _PRICE_CEILING)
+
+    # Round to nearest $25
+    price = round(price / 25) * 25
+    item["unit_price_usd"] = price
+    item["line_total_usd"] = price * item.get("qty", 1)
+
+
+def _apply_item_multiplier(item: PricedItem, multiplier: float) -> None:
+    # Scale, then round to nearest $25
+    item["unit_price_usd"] = round(item["unit_price_usd"] * multiplier / 25) * 25
+    item["line_total_usd"] = round(item["line_total_usd"] * multiplier / 25) * 25
+
+
+def stabilize_prices(items: List[PricedItem]) -> List[PricedItem]:
     """Ensure prices stay within defined ranges and are consistent."""
-    
-    PRICE_RANGES = {
-        "minor": (75, 300),
-        "moderate": (300, 1000),
-        "major": (1000, 2500),
-        "replacement": (2500, 5000)
-    }
-    
     for item in items:
-        current_price = item.get("unit_price_usd", 0)
-        
-        # Determine price tier
-        if current_price <= 300:
-            tier = "minor"
-        elif current_price <= 1000:
-            tier = "moderate"
-        elif current_price <= 2500:
-            tier = "major"
-        else:
-            tier = "replacement"
-        
-        min_price, max_price = PRICE_RANGES[tier]
-        
-        # Clamp price to range
-        if current_price < min_price:
-            item["unit_price_usd"] = min_price
-        elif current_price > max_price:
-            item["unit_price_usd"] = max_price
-        
-        # Round to nearest $25
-        item["unit_price_usd"] = round(item["unit_price_usd"] / 25) * 25
-        item["line_total_usd"] = item["unit_price_usd"] * item.get("qty", 1)
+        _stabilize_item_price(item)
     
     return items
 
@@ -2172,15 +2648,28 @@ def apply_regional_adjustment(items: List[Dict], region: str = "Default") -> Lis
     
     if multiplier != 1.00:
         for item in items:
-            item["unit_price_usd"] *= multiplier
-            item["line_total_usd"] *= multiplier
-            # Round to nearest $25
-            item["unit_price_usd"] = round(item["unit_price_usd"] / 25) * 25
-            item["line_total_usd"] = round(item["line_total_usd"] / 25) * 25
+            _apply_item_multiplier(item, multiplier)
     
     return items
 
 
+def finalize_prices(items: List[PricedItem], region: str = "Default") -> List[PricedItem]:
+    """
+    Stabilize prices and apply the regional multiplier in one pass.
+
+    Same result as stabilize_prices followed by apply_regional_adjustment.
+    """
+    multiplier = TEXAS_REGIONAL_MULTIPLIERS.get(region, 1.00)
+    adjust = multiplier != 1.00
+
+    for item in items:
+        _stabilize_item_price(item)
+        if adjust:
+            _apply_item_multiplier(item, multiplier)
+
+    return items
+
+
 def validate_consolidation_ratio(issues_count: int, items_count: int) -> Dict[str, Any]:
     """
     PHASE 1: Validate that consolidation ratio stays within acceptable range.
@@ -2223,6 +2712,44 @@ def validate_consolidation_ratio(issues_count: int, items_count: int) -> Dict[st
     return consolidation_data
 
 
+# Safety/structural keywords that justify HIGH priority
+_SAFETY_KEYWORDS = frozenset({
+    # Electrical hazards
+    "exposed wiring", "live wire", "electrical fire", "shock hazard",
+    "short circuit", "electrical hazard", "damaged wire", "bare wire",
+    "overloaded", "arcing", "sparking",
+
+    # Water/Moisture hazards
+    "active leak", "water damage", "mold", "moisture intrusion",
+    "wet", "water intrusion", "flooding", "water pooling",
+    "ice dam", "moisture problem",
+
+    # Structural issues
+    "foundation crack", "wall damage", "floor settling", "compromised",
+    "structural damage", "foundation problem", "crack", "subsidence",
+    "bowing", "leaning", "separation",
+
+    # Gas/HVAC hazards
+    "gas leak", "carbon monoxide", "unsafe appliance", "gas odor",
+    "ventilation problem", "blocked vent", "dangerous"
+})
+
+# Maintenance keywords that should be LOW
+_MAINTENANCE_KEYWORDS = frozenset({
+    "worn knob", "worn handle", "worn hinge", "worn finish",
+    "dirty filter", "low refrigerant", "low battery",
+    "paint", "staining", "discoloration", "worn",
+    "adjustment", "tightening", "caulking", "weatherstrip",
+    "minor", "routine", "maintenance", "preventive",
+    "replace filter", "inspection only"
+})
+
+# Each keyword set compiled into one alternation, so an issue's text is
+# scanned once per set instead of once per keyword
+_SAFETY_KEYWORD_RE = _compile_keywords(tuple(sorted(_SAFETY_KEYWORDS)))
+_MAINTENANCE_KEYWORD_RE = _compile_keywords(tuple(sorted(_MAINTENANCE_KEYWORDS)))
+
+
 def fix_priority_classification(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     """
     PHASE 1: Fix over-flagged priority classification.
@@ -2248,48 +2775,16 @@ def fix_priority_classification(issues: List[Dict[str, Any]]) -> List[Dict[str,
     Returns:
         List of issues with corrected priority classification
     """
-    # Safety/structural keywords that justify HIGH priority
-    safety_keywords = {
-        # Electrical hazards
-        "exposed wiring", "live wire", "electrical fire", "shock hazard",
-        "short circuit", "electrical hazard", "damaged wire", "bare wire",
-        "overloaded", "arcing", "sparking",
-        
-        # Water/Moisture hazards
-        "active leak", "water damage", "mold", "moisture intrusion",
-        "wet", "water intrusion", "flooding", "water pooling",
-        "ice dam", "moisture problem",
-        
-        # Structural issues
-        "foundation crack", "wall damage", "floor settling", "compromised",
-        "structural damage", "foundation problem", "crack", "subsidence",
-        "bowing", "leaning", "separation",
-        
-        # Gas/HVAC hazards
-        "gas leak", "carbon monoxide", "unsafe appliance", "gas odor",
-        "ventilation problem", "blocked vent", "dangerous"
-    }
-    
-    # Maintenance keywords that should be LOW
-    maintenance_keywords = {
-        "worn knob", "worn handle", "worn hinge", "worn finish",
-        "dirty filter", "low refrigerant", "low battery",
-        "paint", "staining", "discoloration", "worn",
-        "adjustment", "tightening", "caulking", "weatherstrip",
-        "minor", "routine", "maintenance", "preventive",
-        "replace filter", "inspection only"
-    }
-    
     for issue in issues:
         description = (issue.get("description", "") + " " + issue.get("notes", "")).lower()
         title = issue.get("title", "").lower()
         full_text = f"{title} {description}"
         
         # Check if it's a safety/structural issue
-        is_safety = any(keyword in full_text for keyword in safety_keywords)
+        is_safety = _SAFETY_KEYWORD_RE.search(full_text) is not None
         
-        # Check if it's maintenance
-        is_maintenance = any(keyword in full_text for keyword in maintenance_keywords)
+        # Check if it's maintenance (only matters when not a safety issue)
+        is_maintenance = not is_safety and _MAINTENANCE_KEYWORD_RE.search(full_text) is not None
         
         # Apply corrected priority
         original_priority = issue.get("priority", "MODERATE")
@@ -2322,17 +2817,28 @@ def normalize_model_name(model_name: str) -> str:
     return model_name if "/" in model_name else f"models/{model_name}"
 
 
+# Response type -> attribute ("output_text" or "text") that last yielded text
+_TEXT_ATTR_BY_TYPE: Dict[type, str] = {}
+
+
 def extract_text(response: Any) -> str:
     """Extract text from Gemini response."""
-    # Try output_text first (common for JSON responses)
-    text = getattr(response, "output_text", None)
-    if text:
-        return text
-    
-    # Try text attribute
-    text = getattr(response, "text", None)
-    if text:
-        return text
+    # Fast path: the attribute that worked for this response type before
+    response_type = type(response)
+    known_attr = _TEXT_ATTR_BY_TYPE.get(response_type)
+    if known_attr is not None:
+        text = getattr(response, known_attr, None)
+        if text:
+            return text
+
+    # Try output_text first (common for JSON responses), then text
+    for attr in ("output_text", "text"):
+        if attr == known_attr:
+            continue
+        text = getattr(response, attr, None)
+        if text:
+            _TEXT_ATTR_BY_TYPE[response_type] = attr
+            return text
     
     # Try candidates (for non-JSON responses)
     candidates = getattr(response, "candidates", None) or []
@@ -2363,32 +2869,55 @@ def extract_text(response: Any) -> str:
     raise ValueError("Gemini returned an empty response.")
 
 
-def compute_category_totals(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """Compute totals by category."""
-    totals_by_category = {}
-    
+def _line_totals(items: List[Dict[str, Any]]) -> Tuple[Dict[str, float], float]:
+    """Sum line_total_usd per category and overall in a single pass."""
+    # int default keeps all-integer totals as ints in the estimate JSON
+    totals_by_category: Dict[str, float] = defaultdict(int)
+    total = 0
+
     for item in items:
-        category = item.get("category", "MISCELLANEOUS")
-        if category not in totals_by_category:
-            totals_by_category[category] = 0
-        totals_by_category[category] += item.get("line_total_usd", 0)
-    
+        amount = item.get("line_total_usd", 0)
+        totals_by_category[item.get("category", "MISCELLANEOUS")] += amount
+        total += amount
+
+    return totals_by_category, total
+
+
+def _category_total_rows(totals_by_category: Dict[str, float]) -> List[Dict[str, Any]]:
     return [
-        {"category": cat, "total_usd": total}
-        for cat, total in sorted(totals_by_category.items())
+        {"category": cat, "total_usd": totals_by_category[cat]}
+        for cat in sorted(totals_by_category)
     ]
 
 
-def compute_summary(items: List[Dict[str, Any]]) -> Dict[str, Any]:
-    """Compute summary totals."""
-    total = sum(item.get("line_total_usd", 0) for item in items)
-    
+def compute_category_totals(items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Compute totals by category."""
+    totals_by_category, _ = _line_totals(items)
+    return _category_total_rows(totals_by_category)
+
+
+def _summary_row(total: float, items_count: int) -> Dict[str, Any]:
     return {
         "total_usd": total,
-        "items_count": len(items)
+        "items_count": items_count
     }
 
 
+def compute_summary(items: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute summary totals."""
+    _, total = _line_totals(items)
+    return _summary_row(total, len(items))
+
+
+_CANONICAL_CATEGORIES = frozenset(CATEGORIES)
+
+
+@functools.lru_cache(maxsize=4096)
+def _normalize_item_category(category: str, description: str, notes: str) -> str:
+    """Memoized normalize_category; estimates repeat the same category/text pairs."""
+    return normalize_category(category, description, notes)
+
+
 def assemble_estimate(
     findings: Dict[str, Any],
     items: List[Dict[str, Any]],
@@ -2396,41 +2925,54 @@ def assemble_estimate(
     state: str,
     consolidation_check: Optional[Dict[str, Any]] = None,
     category_consolidation: Optional[Dict[str, Any]] = None,
-    quality_score: Optional[Dict[str, Any]] = None
+    quality_score: Optional[Dict[str, Any]] = None,
+    created_on: Optional[str] = None
 ) -> Dict[str, Any]:
-    """Assemble final estimate structure."""
+    """Assemble final estimate structure.
+
+    created_on defaults to the current UTC time in ISO format.
+    """
+    if created_on is None:
+        created_on = datetime.now(timezone.utc).isoformat()
+
+    disclaimer_for = DISCLAIMER_TEMPLATES.get
+    default_disclaimer = "Estimate reflects Texas state market conditions."
 
-    # Normalize categories for all items
+    # Normalize categories for all items; canonical names pass through as-is
     for item in items:
         original_cat = item.get("category", "")
-        item["category"] = normalize_category(
-            original_cat,
-            item.get("description", ""),
-            item.get("notes", "")
-        )
+        if original_cat in _CANONICAL_CATEGORIES:
+            category = original_cat
+        else:
+            item["category"] = category = _normalize_item_category(
+                original_cat,
+                item.get("description", ""),
+                item.get("notes", "")
+            )
 
         # Ensure disclaimer is present
         if not item.get("disclaimer"):
-            item["disclaimer"] = DISCLAIMER_TEMPLATES.get(
-                item["category"],
-                "Estimate reflects Texas state market conditions."
-            )
+            item["disclaimer"] = disclaimer_for(category, default_disclaimer)
+
+    meta = findings.get("metadata") or {}
 
-    category_totals = compute_category_totals(items)
-    summary = compute_summary(items)
+    # Category totals and the grand total come from one pass over items
+    totals_by_category, total = _line_totals(items)
+    category_totals = _category_total_rows(totals_by_category)
+    summary = _summary_row(total, len(items))
 
     estimate = {
         "estimate_meta": {
-            "created_on": datetime.now(timezone.utc).isoformat(),
+            "created_on": created_on,
             "city": city,
             "state": state,
-            "inspection_date": findings.get("metadata", {}).get("date", ""),
+            "inspection_date": meta.get("date", ""),
         },
         "property": {
-            "address": findings.get("metadata", {}).get("address", ""),
-            "city": findings.get("metadata", {}).get("city", city),
-            "state": findings.get("metadata", {}).get("state", state),
-            "zip": findings.get("metadata", {}).get("zip", ""),
+            "address": meta.get("address", ""),
+            "city": meta.get("city", city),
+            "state": meta.get("state", state),
+            "zip": meta.get("zip", ""),
         },
         "items": items,
         "category_totals": category_totals,
@@ -2488,6 +3030,11 @@ def parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip AI refinement and use only internal pricing.",
     )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Price issues through the Gemini Batch API (lower cost, may take hours).",
+    )
     parser.add_argument(
         "--no-consolidate",
         action="store_true",
@@ -2516,14 +3063,21 @@ def apply_cost_ceiling(items: List[Dict[str, Any]], max_total: float = 18000) ->
         LOGGER.warning(f"Total ${current_total:,.0f} exceeds max ${max_total:,.0f}. Applying {(1-reduction_factor)*100:.1f}% reduction.")
         
         for item in items:
-            item["unit_price_usd"] *= reduction_factor
-            item["line_total_usd"] *= reduction_factor
-            item["unit_price_usd"] = round(item["unit_price_usd"] / 25) * 25
-            item["line_total_usd"] = round(item["line_total_usd"] / 25) * 25
+            _apply_item_multiplier(item, reduction_factor)
     
     return items
 
 
+# Display order of categories in the final estimate; unknown categories sort last
+_CATEGORY_SORT_INDEX = {
+    category: index
+    for index, category in enumerate([
+        "FOUNDATION", "ROOF", "PLUMBING", "ELECTRICAL", "HVAC",
+        "WINDOWS/DOORS", "ATTIC", "MISCELLANEOUS"
+    ])
+}
+
+
 def main() -> int:
     """Main entry point."""
     args = parse_args()
@@ -2536,8 +3090,8 @@ def main() -> int:
     
     # Load findings
     try:
-        with open(args.findings_path, 'r') as f:
-            findings = json.load(f)
+        with open(args.findings_path, 'rb') as f:
+            findings = _loads_json(f.read())
     except Exception as e:
         LOGGER.error(f"Failed to load findings: {e}")
         return 1
@@ -2585,8 +3139,12 @@ def main() -> int:
             return 1
 
         def run_pricing(client):
-            # PHASE 1: Individual pricing with Gemini
-            priced_items, _ = call_gemini_for_individual_pricing(
+            # PHASE 1: Individual pricing with Gemini (optionally as a batch job)
+            price_issues = (
+                call_gemini_for_individual_pricing_batch if args.batch
+                else call_gemini_for_individual_pricing
+            )
+            priced_items, _ = price_issues(
                 client,
                 args.ai_model,
                 normalized_issues,
@@ -2595,7 +3153,7 @@ def main() -> int:
             return priced_items
 
         try:
-            client = genai.Client(api_key=api_key)
+            client = _load_genai().Client(api_key=api_key)
             priced_items = run_pricing(client)
         except Exception as e:
             LOGGER.error(f"Failed to get AI pricing: {e}")
@@ -2633,15 +3191,12 @@ def main() -> int:
         else:
             items = priced_items
 
-    # Stabilize prices (round to nearest $25)
-    items = stabilize_prices(items)
-    
     # Apply cost ceiling - REMOVED per Phase 1 (artificial cap causes price destruction)
     # items = apply_cost_ceiling(items, max_total=18000)  # REMOVED - artificial cap
     LOGGER.info("Cost ceiling removed - using actual market rates")
     
-    # Apply regional adjustment
-    items = apply_regional_adjustment(items, args.region)
+    # Stabilize prices (round to nearest $25) and apply regional adjustment
+    items = finalize_prices(items, args.region)
     
     # PHASE 1: Validate consolidation ratio (3:1 to 5:1)
     consolidation_check = validate_consolidation_ratio(len(issues), len(items))
@@ -2678,11 +3233,12 @@ def main() -> int:
         )
 
     # Log factor breakdown
-    LOGGER.info("Quality Factor Breakdown:")
-    for factor, details in quality_score["breakdown"].items():
-        score = details["score"]
-        weight = details["weight"] * 100
-        LOGGER.info(f"  • {factor.replace('_', ' ').title()}: {score:.1f}/100 (weight: {weight:.0f}%)")
+    if LOGGER.isEnabledFor(logging.INFO):
+        LOGGER.info("Quality Factor Breakdown:")
+        for factor, details in quality_score["breakdown"].items():
+            score = details["score"]
+            weight = details["weight"] * 100
+            LOGGER.info(f"  • {factor.replace('_', ' ').title()}: {score:.1f}/100 (weight: {weight:.0f}%)")
 
     LOGGER.info("=" * 60)
 
@@ -2696,10 +3252,11 @@ def main() -> int:
         LOGGER.error("Primary issues:")
 
         # Identify the worst-performing factors
-        worst_factors = sorted(
+        worst_factors = heapq.nsmallest(
+            3,
             quality_score["breakdown"].items(),
             key=lambda x: x[1]["score"]
-        )[:3]
+        )
 
         for factor, details in worst_factors:
             LOGGER.error(f"  • {factor.replace('_', ' ').title()}: {details['score']:.1f}/100")
@@ -2719,11 +3276,8 @@ def main() -> int:
         LOGGER.error("=" * 60)
 
     # Sort items by category for consistent ordering
-    category_order = ["FOUNDATION", "ROOF", "PLUMBING", "ELECTRICAL", "HVAC", 
-                      "WINDOWS/DOORS", "ATTIC", "MISCELLANEOUS"]
-    items = sorted(items, key=lambda x: (
-        category_order.index(x.get("category", "MISCELLANEOUS")) 
-        if x.get("category") in category_order else 999,
+    items.sort(key=lambda x: (
+        _CATEGORY_SORT_INDEX.get(x.get("category"), 999),
         x.get("description", "")
     ))
     
@@ -2733,24 +3287,31 @@ def main() -> int:
         items = aggressive_consolidation(items)[:25]  # Force to 25 max
     
     # Assemble final estimate
+    created_on = datetime.now(timezone.utc).isoformat()
     try:
         estimate = assemble_estimate(
             findings, items, args.region, args.state,
             consolidation_check=consolidation_check,
             category_consolidation=category_consolidation,
-            quality_score=quality_score
+            quality_score=quality_score,
+            created_on=created_on
         )
     except Exception as e:
         LOGGER.error(f"Failed to assemble estimate: {e}")
         return 1
     
     # Output estimate
+    estimate_json = _encode_output_json(estimate)
     if args.dry_run:
-        print(json.dumps(estimate, indent=2, ensure_ascii=False))
+        stdout_buffer = getattr(sys.stdout, "buffer", None)
+        if stdout_buffer is None:
+            print(estimate_json.decode("utf-8"))
+        else:
+            # Write the encoded bytes straight through; flush pending text first
+            sys.stdout.flush()
+            stdout_buffer.write(estimate_json + b"\n")
     else:
-        with open(args.out, "w", encoding="utf-8") as output_file:
-            json.dump(estimate, output_file, indent=2, ensure_ascii=False)
-            output_file.write("\n")
+        _write_bytes_atomic(Path(args.out), estimate_json + b"\n")
         LOGGER.info(f"Estimate written to {args.out}")
     
     # Print summary
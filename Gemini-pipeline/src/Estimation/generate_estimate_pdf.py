@@ -10,7 +10,11 @@ import argparse
 import json
 import os
 import sys
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
@@ -20,6 +24,8 @@ from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph,
 from reportlab.lib.enums import TA_CENTER, TA_RIGHT, TA_LEFT
 from reportlab.pdfgen import canvas
 
+from json_io import loads_json
+
 # Import trade categorizer
 try:
     from trade_categorizer import normalize_category as trade_normalize
@@ -29,6 +35,155 @@ except ImportError:
         return category.upper()
 
 
+# Display order of category sections in the PDF
+_CATEGORY_ORDER = (
+    "FOUNDATION", "ROOF", "PLUMBING", "ELECTRICAL",
+    "HVAC", "WINDOWS/DOORS", "ATTIC", "MISCELLANEOUS"
+)
+
+# Stylesheet and paragraph styles, built once at import and shared by every PDF
+_STYLES = getSampleStyleSheet()
+
+# Custom styles
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=20,
+    textColor=colors.HexColor('#003366'),
+    spaceAfter=20,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+
+_HEADER_STYLE = ParagraphStyle(
+    'Header',
+    parent=_STYLES['Normal'],
+    fontSize=14,
+    textColor=colors.HexColor('#003366'),
+    spaceAfter=10,
+    fontName='Helvetica-Bold'
+)
+
+_CATEGORY_STYLE = ParagraphStyle(
+    'Category',
+    parent=_STYLES['Normal'],
+    fontSize=12,
+    textColor=colors.white,
+    backColor=colors.HexColor('#003366'),
+    leftIndent=10,
+    spaceAfter=5,
+    fontName='Helvetica-Bold'
+)
+
+# Row styles shared by every line item
+_DESC_STYLE = ParagraphStyle(
+    'DescriptionStyle',
+    parent=_STYLES['Normal'],
+    fontSize=9,
+    textColor=colors.black,
+    leftIndent=0,
+    rightIndent=0,
+    spaceAfter=2,
+    spaceBefore=2,
+    leading=11,
+    wordWrap='CJK'
+)
+
+# Multi-line detailed notes - format as a list with better spacing
+_DETAILED_NOTE_STYLE = ParagraphStyle(
+    'DetailedNoteStyle',
+    parent=_STYLES['Normal'],
+    fontSize=8.5,
+    textColor=colors.HexColor('#333333'),
+    leftIndent=5,
+    rightIndent=5,
+    spaceAfter=3,
+    spaceBefore=3,
+    leading=13,  # Increased line height to prevent cutoff
+    bulletIndent=5,
+    wordWrap='CJK'
+)
+
+# Single-line note - use compact style
+_NOTE_STYLE = ParagraphStyle(
+    'NoteStyle',
+    parent=_STYLES['Normal'],
+    fontSize=8.5,
+    textColor=colors.HexColor('#333333'),
+    leftIndent=5,
+    rightIndent=5,
+    spaceAfter=3,
+    spaceBefore=3,
+    leading=12,  # Increased line height
+    wordWrap='CJK'
+)
+
+
+# Fixed table styles; item tables add their note and subtotal rows on top of the base
+_PROPERTY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('SPAN', (0, 0), (-1, 0)),
+    ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
+    ('ALIGN', (0, 1), (0, -1), 'RIGHT'),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+])
+
+_CATEGORY_HEADER_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#003366')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 11),
+    ('LEFTPADDING', (0, 0), (-1, -1), 10),
+    ('TOPPADDING', (0, 0), (-1, -1), 5),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
+])
+
+_ITEM_TABLE_BASE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e0e0e0')),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 9),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ALIGN', (0, 0), (0, -1), 'CENTER'),
+    ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
+    ('VALIGN', (0, 0), (-1, -1), 'TOP'),
+    # Increased padding for all cells to prevent text cutoff
+    ('LEFTPADDING', (0, 0), (-1, -1), 8),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+    ('TOPPADDING', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
+])
+_NOTE_ROW_BACKGROUND = colors.HexColor('#f9f9f9')
+_SUBTOTAL_ROW_BACKGROUND = colors.HexColor('#ffff99')
+
+_GRAND_TOTAL_TABLE_STYLE = TableStyle([
+    # Background and text color
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#003366')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 16),
+    # Alignment
+    ('ALIGN', (0, 0), (0, 0), 'LEFT'),  # Label aligned left
+    ('ALIGN', (1, 0), (1, 0), 'RIGHT'),  # Amount aligned right
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    # Generous padding to prevent text cutoff
+    ('TOPPADDING', (0, 0), (-1, -1), 20),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
+    ('LEFTPADDING', (0, 0), (0, 0), 20),
+    ('RIGHTPADDING', (1, 0), (1, 0), 20),
+    # Border
+    ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#003366')),
+])
+
+
 def truncate_text(text, max_length=200):
     """Truncate text to max_length characters, adding ellipsis if needed."""
     if not text:
@@ -44,8 +199,9 @@ def format_currency(amount):
     return f"${amount:,.2f}"
 
 
+@lru_cache(maxsize=4096)
 def normalize_category(category, description, notes=""):
-    """Use trade-based categorization."""
+    """Use trade-based categorization (memoized; estimates repeat line items)."""
     return trade_normalize(category, description, notes)
 
 
@@ -57,8 +213,12 @@ def create_professional_pdf(json_data, output_path):
     metadata = json_data.get('estimate_meta', {})
     property_info = json_data.get('property', {})
     
-    # Get property address for header
-    property_address = property_info.get('address', metadata.get('prepared_for', {}).get('address', 'N/A'))
+    # Property fields for the page header and the property table
+    prepared_for = metadata.get('prepared_for', {})
+    property_address = property_info.get('address', prepared_for.get('address', 'N/A'))
+    property_city = property_info.get('city', prepared_for.get('city', ''))
+    property_state = property_info.get('state', prepared_for.get('state', 'TX'))
+    property_zip = property_info.get('zip', prepared_for.get('zip', ''))
     
     # Create document
     doc = SimpleDocTemplate(
@@ -70,76 +230,30 @@ def create_professional_pdf(json_data, output_path):
         bottomMargin=1*inch
     )
     
-    # Set up page templates with headers/footers
-    def on_first_page(canvas_obj, doc_obj):
-        """Draw header on first page."""
-        canvas_obj.saveState()
-        canvas_obj.setFont("Helvetica-Bold", 10)
-        canvas_obj.drawString(inch, 10.5 * inch, "REPAIR ESTIMATE")
-        canvas_obj.setFont("Helvetica", 9)
-        if property_address:
-            address_text = property_address[:50] if len(property_address) > 50 else property_address
-            canvas_obj.drawString(inch, 10.3 * inch, address_text)
-        canvas_obj.drawRightString(7.5 * inch, 10.3 * inch, "Page 1")
-        
-        # Footer
-        canvas_obj.setFont("Helvetica", 8)
-        canvas_obj.drawString(inch, 0.5 * inch, "This estimate is valid for 30 days")
-        canvas_obj.drawRightString(7.5 * inch, 0.5 * inch, datetime.now().strftime("%B %d, %Y"))
-        canvas_obj.restoreState()
+    # Date shown in the footer of every page and in the property table
+    today = datetime.now()
+    estimate_date = today.strftime('%B %d, %Y')
+    
+    # Header address, truncated once rather than on every page
+    address_text = property_address[:50] if property_address else ""
     
-    def on_later_pages(canvas_obj, doc_obj):
-        """Draw header on subsequent pages."""
-        page_num = canvas_obj.getPageNumber()
+    # Page header/footer, drawn on every page including the first
+    def draw_page_chrome(canvas_obj, doc_obj):
+        """Draw header and footer on a page."""
         canvas_obj.saveState()
         canvas_obj.setFont("Helvetica-Bold", 10)
         canvas_obj.drawString(inch, 10.5 * inch, "REPAIR ESTIMATE")
         canvas_obj.setFont("Helvetica", 9)
-        if property_address:
-            address_text = property_address[:50] if len(property_address) > 50 else property_address
+        if address_text:
             canvas_obj.drawString(inch, 10.3 * inch, address_text)
-        canvas_obj.drawRightString(7.5 * inch, 10.3 * inch, f"Page {page_num}")
+        canvas_obj.drawRightString(7.5 * inch, 10.3 * inch, f"Page {canvas_obj.getPageNumber()}")
         
         # Footer
         canvas_obj.setFont("Helvetica", 8)
         canvas_obj.drawString(inch, 0.5 * inch, "This estimate is valid for 30 days")
-        canvas_obj.drawRightString(7.5 * inch, 0.5 * inch, datetime.now().strftime("%B %d, %Y"))
+        canvas_obj.drawRightString(7.5 * inch, 0.5 * inch, estimate_date)
         canvas_obj.restoreState()
     
-    # Create styles
-    styles = getSampleStyleSheet()
-    
-    # Custom styles
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=20,
-        textColor=colors.HexColor('#003366'),
-        spaceAfter=20,
-        alignment=TA_CENTER,
-        fontName='Helvetica-Bold'
-    )
-    
-    header_style = ParagraphStyle(
-        'Header',
-        parent=styles['Normal'],
-        fontSize=14,
-        textColor=colors.HexColor('#003366'),
-        spaceAfter=10,
-        fontName='Helvetica-Bold'
-    )
-    
-    category_style = ParagraphStyle(
-        'Category',
-        parent=styles['Normal'],
-        fontSize=12,
-        textColor=colors.white,
-        backColor=colors.HexColor('#003366'),
-        leftIndent=10,
-        spaceAfter=5,
-        fontName='Helvetica-Bold'
-    )
-    
     # Build document elements
     story = []
     
@@ -147,80 +261,52 @@ def create_professional_pdf(json_data, output_path):
     # story.append(Image('logo.png', width=2*inch, height=1*inch))
     
     # Title
-    story.append(Paragraph("PROPERTY REPAIR ESTIMATE", title_style))
+    story.append(Paragraph("PROPERTY REPAIR ESTIMATE", _TITLE_STYLE))
     story.append(Spacer(1, 0.25*inch))
     
     # Property Information Table
-    prepared_for = metadata.get('prepared_for', {})
     property_data = [
         ['PROPERTY INFORMATION', ''],
-        ['Address:', property_info.get('address', prepared_for.get('address', 'N/A'))],
-        ['City/State/Zip:', f"{property_info.get('city', prepared_for.get('city', ''))}, {property_info.get('state', prepared_for.get('state', 'TX'))} {property_info.get('zip', prepared_for.get('zip', ''))}"],
+        ['Address:', property_address],
+        ['City/State/Zip:', f"{property_city}, {property_state} {property_zip}"],
         ['Inspection Date:', metadata.get('inspection_date', 'N/A')],
-        ['Estimate Date:', datetime.now().strftime('%B %d, %Y')],
-        ['Estimate Valid Until:', (datetime.now() + timedelta(days=30)).strftime('%B %d, %Y')]
+        ['Estimate Date:', estimate_date],
+        ['Estimate Valid Until:', (today + timedelta(days=30)).strftime('%B %d, %Y')]
     ]
     
     property_table = Table(property_data, colWidths=[2*inch, 4.5*inch])
-    property_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#003366')),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 12),
-        ('SPAN', (0, 0), (-1, 0)),
-        ('ALIGN', (0, 0), (-1, 0), 'CENTER'),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0f0f0')),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ('FONTNAME', (0, 1), (0, -1), 'Helvetica-Bold'),
-        ('ALIGN', (0, 1), (0, -1), 'RIGHT'),
-        ('LEFTPADDING', (0, 0), (-1, -1), 10),
-        ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-        ('TOPPADDING', (0, 0), (-1, -1), 5),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-    ]))
+    property_table.setStyle(_PROPERTY_TABLE_STYLE)
     
     story.append(property_table)
     story.append(Spacer(1, 0.5*inch))
     
     # Group items by category
-    items_by_category = {}
+    items_by_category = defaultdict(list)
     for item in items:
         cat = normalize_category(
             item.get('category', 'MISCELLANEOUS'),
             item.get('description', ''),
             item.get('notes', '')
         )
-        if cat not in items_by_category:
-            items_by_category[cat] = []
         items_by_category[cat].append(item)
     
-    # Category order
-    category_order = [
-        "FOUNDATION", "ROOF", "PLUMBING", "ELECTRICAL", 
-        "HVAC", "WINDOWS/DOORS", "ATTIC", "MISCELLANEOUS"
-    ]
+    # Known categories in display order, then any other category the
+    # categorizer returned (so its items still appear in the estimate)
+    ordered_categories = []
+    for category in _CATEGORY_ORDER:
+        cat_items = items_by_category.pop(category, None)
+        if cat_items:
+            ordered_categories.append((category, cat_items))
+    ordered_categories.extend(items_by_category.items())
     
     # Create estimate table for each category
     grand_total = 0
     
-    for category in category_order:
-        if category not in items_by_category:
-            continue
-            
-        cat_items = items_by_category[category]
-        
+    for category, cat_items in ordered_categories:
         # Category header
         cat_header = [[category]]
         cat_header_table = Table(cat_header, colWidths=[6.5*inch])
-        cat_header_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#003366')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 11),
-            ('LEFTPADDING', (0, 0), (-1, -1), 10),
-            ('TOPPADDING', (0, 0), (-1, -1), 5),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 5),
-        ]))
+        cat_header_table.setStyle(_CATEGORY_HEADER_TABLE_STYLE)
         story.append(cat_header_table)
         
         # Items table
@@ -236,27 +322,15 @@ def create_professional_pdf(json_data, output_path):
 
             # Use Paragraph for description to allow proper text wrapping
             description = item.get('description', '')
-            desc_style = ParagraphStyle(
-                'DescriptionStyle',
-                parent=getSampleStyleSheet()['Normal'],
-                fontSize=9,
-                textColor=colors.black,
-                leftIndent=0,
-                rightIndent=0,
-                spaceAfter=2,
-                spaceBefore=2,
-                leading=11,
-                wordWrap='CJK'
-            )
-            desc_para = Paragraph(description, desc_style)
+            desc_para = Paragraph(description, _DESC_STYLE)
 
-            data.append([
-                str(idx),
+            data.append((
+                f"{idx}",
                 desc_para,
-                str(qty),
-                f"${unit_price:,.2f}",
-                f"${total:,.2f}"
-            ])
+                f"{qty}",
+                format_currency(unit_price),
+                format_currency(total)
+            ))
 
             # Add notes row if present
             if item.get('notes'):
@@ -264,65 +338,28 @@ def create_professional_pdf(json_data, output_path):
 
                 # Check if notes contain line breaks (detailed multi-item notes)
                 if '\n' in notes_text:
-                    # Multi-line detailed notes - format as a list with better spacing
-                    note_style = ParagraphStyle(
-                        'DetailedNoteStyle',
-                        parent=getSampleStyleSheet()['Normal'],
-                        fontSize=8.5,
-                        textColor=colors.HexColor('#333333'),
-                        leftIndent=5,
-                        rightIndent=5,
-                        spaceAfter=3,
-                        spaceBefore=3,
-                        leading=13,  # Increased line height to prevent cutoff
-                        bulletIndent=5,
-                        wordWrap='CJK'
-                    )
-                    # Replace line breaks with HTML breaks for proper rendering
+                    # Multi-line detailed notes - replace line breaks with HTML breaks for proper rendering
                     formatted_notes = notes_text.replace('\n', '<br/>')
-                    note_para = Paragraph(f"<b>Includes:</b><br/>{formatted_notes}", note_style)
+                    note_para = Paragraph(f"<b>Includes:</b><br/>{formatted_notes}", _DETAILED_NOTE_STYLE)
                 else:
                     # Single-line note - use compact style
-                    note_style = ParagraphStyle(
-                        'NoteStyle',
-                        parent=getSampleStyleSheet()['Normal'],
-                        fontSize=8.5,
-                        textColor=colors.HexColor('#333333'),
-                        leftIndent=5,
-                        rightIndent=5,
-                        spaceAfter=3,
-                        spaceBefore=3,
-                        leading=12,  # Increased line height
-                        wordWrap='CJK'
-                    )
-                    note_para = Paragraph(f"<b>Details:</b> {notes_text}", note_style)
+                    note_para = Paragraph(f"<b>Details:</b> {notes_text}", _NOTE_STYLE)
 
                 data.append(['', note_para, '', '', ''])
                 note_rows.append(len(data) - 1)  # Track this row index
         
         # Add category subtotal
-        data.append(['', '', '', 'Subtotal:', f"${category_total:,.2f}"])
+        data.append(['', '', '', 'Subtotal:', format_currency(category_total)])
         grand_total += category_total
         
         # Create table
         col_widths = [0.4*inch, 3.8*inch, 0.6*inch, 1*inch, 1*inch]
         items_table = Table(data, colWidths=col_widths)
         
-        # Style the table with better padding to prevent text cutoff
-        table_style = [
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e0e0e0')),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 9),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ALIGN', (0, 0), (0, -1), 'CENTER'),
-            ('ALIGN', (2, 0), (-1, -1), 'RIGHT'),
-            ('VALIGN', (0, 0), (-1, -1), 'TOP'),
-            # Increased padding for all cells to prevent text cutoff
-            ('LEFTPADDING', (0, 0), (-1, -1), 8),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-            ('TOPPADDING', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 10),
-        ]
+        # Style the table with better padding to prevent text cutoff;
+        # only the note and subtotal rows need per-table commands
+        items_table.setStyle(_ITEM_TABLE_BASE_STYLE)
+        table_style = []
 
         # Add extra padding for note rows to make them more readable
         for note_row in note_rows:
@@ -330,11 +367,11 @@ def create_professional_pdf(json_data, output_path):
             table_style.append(('BOTTOMPADDING', (0, note_row), (-1, note_row), 14))
             table_style.append(('LEFTPADDING', (1, note_row), (1, note_row), 18))
             table_style.append(('RIGHTPADDING', (1, note_row), (1, note_row), 18))
-            table_style.append(('BACKGROUND', (0, note_row), (-1, note_row), colors.HexColor('#f9f9f9')))
+            table_style.append(('BACKGROUND', (0, note_row), (-1, note_row), _NOTE_ROW_BACKGROUND))
             table_style.append(('VALIGN', (0, note_row), (-1, note_row), 'TOP'))
 
         # Highlight subtotal row
-        table_style.append(('BACKGROUND', (0, len(data)-1), (-1, len(data)-1), colors.HexColor('#ffff99')))
+        table_style.append(('BACKGROUND', (0, len(data)-1), (-1, len(data)-1), _SUBTOTAL_ROW_BACKGROUND))
         table_style.append(('FONTNAME', (3, len(data)-1), (-1, len(data)-1), 'Helvetica-Bold'))
         
         items_table.setStyle(TableStyle(table_style))
@@ -347,46 +384,38 @@ def create_professional_pdf(json_data, output_path):
 
     # Create a simple 2-column table for Grand Total with proper spacing
     total_data = [
-        ['GRAND TOTAL:', f"${grand_total:,.2f}"]
+        ['GRAND TOTAL:', format_currency(grand_total)]
     ]
 
     # Use wider columns to prevent text squishing
     total_table = Table(total_data, colWidths=[2.5*inch, 2.0*inch])
-    total_table.setStyle(TableStyle([
-        # Background and text color
-        ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#003366')),
-        ('TEXTCOLOR', (0, 0), (-1, -1), colors.white),
-        ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, -1), 16),
-        # Alignment
-        ('ALIGN', (0, 0), (0, 0), 'LEFT'),  # Label aligned left
-        ('ALIGN', (1, 0), (1, 0), 'RIGHT'),  # Amount aligned right
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        # Generous padding to prevent text cutoff
-        ('TOPPADDING', (0, 0), (-1, -1), 20),
-        ('BOTTOMPADDING', (0, 0), (-1, -1), 20),
-        ('LEFTPADDING', (0, 0), (0, 0), 20),
-        ('RIGHTPADDING', (1, 0), (1, 0), 20),
-        # Border
-        ('BOX', (0, 0), (-1, -1), 2, colors.HexColor('#003366')),
-    ]))
+    total_table.setStyle(_GRAND_TOTAL_TABLE_STYLE)
 
     story.append(total_table)
     story.append(Spacer(1, 1.0*inch))  # Increased spacing after total
     
     # Build PDF with page templates
-    doc.build(story, onFirstPage=on_first_page, onLaterPages=on_later_pages)
+    doc.build(story, onFirstPage=draw_page_chrome, onLaterPages=draw_page_chrome)
     
     return True
 
 
 def create_pdf_from_json(json_path, output_path):
     """Main entry point for PDF generation."""
+    return _render_json_file(json_path, output_path)[0]
+
+
+def _render_json_file(json_path, output_path):
+    """Parse an estimate JSON file once and render its PDF.
+
+    Returns ``(success, item_count)`` so callers can log the item count
+    without reading the file a second time.
+    """
     try:
         # Load JSON data
         json_path_str = str(json_path)
-        with open(json_path_str, 'r', encoding='utf-8') as f:
-            json_data = json.load(f)
+        with open(json_path_str, 'rb') as f:
+            json_data = loads_json(f.read())
         
         # Ensure property information is present
         if 'property' not in json_data:
@@ -403,19 +432,19 @@ def create_pdf_from_json(json_path, output_path):
         items = json_data.get('items', [])
         if not items:
             print(f"⚠️  Warning: No items found in {json_path_str}")
-            return False
+            return False, 0
         
         # Create professional PDF
-        return create_professional_pdf(json_data, output_path)
+        return create_professional_pdf(json_data, output_path), len(items)
         
     except json.JSONDecodeError as e:
         print(f"❌ Error: Invalid JSON in {json_path_str}: {e}")
-        return False
+        return False, 0
     except Exception as e:
         print(f"❌ Error creating PDF: {e}")
         import traceback
         traceback.print_exc()
-        return False
+        return False, 0
 
 
 def process_single_file(json_file_path, output_dir):
@@ -436,17 +465,9 @@ def process_single_file(json_file_path, output_dir):
     pdf_filename = json_file.stem + '.pdf'
     pdf_path = output_dir / pdf_filename
     
-    # Read JSON to get item count for logging
-    try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        item_count = len(data.get('items', []))
-    except Exception as e:
-        print(f"⚠️  Warning: Could not read item count: {e}")
-        item_count = 0
-    
     # Generate PDF
-    if create_pdf_from_json(json_file, pdf_path):
+    success, item_count = _render_json_file(json_file, pdf_path)
+    if success:
         print(f"✅ Loaded {json_file.name} ({item_count} items)")
         print(f"✅ Generated PDF: {pdf_path}")
         return True
@@ -455,8 +476,22 @@ def process_single_file(json_file_path, output_dir):
         return False
 
 
-def process_all_files(input_dir, output_dir):
-    """Process all JSON files in the input directory."""
+def _process_one(json_file, output_dir):
+    """Generate the PDF for one JSON file; runs in a worker process for process_all_files."""
+    # Generate output filename
+    pdf_filename = json_file.stem + '.pdf'
+    pdf_path = output_dir / pdf_filename
+    
+    success, item_count = _render_json_file(json_file, pdf_path)
+    return pdf_path, item_count, success
+
+
+def process_all_files(input_dir, output_dir, jobs=None):
+    """Process all JSON files in the input directory.
+
+    PDFs are rendered in up to ``jobs`` worker processes (default: one per
+    CPU); ``jobs=1`` renders them one by one in this process.
+    """
     # Check if input directory exists
     if not input_dir.exists():
         print(f"❌ Error: Input directory not found: {input_dir}")
@@ -471,29 +506,29 @@ def process_all_files(input_dir, output_dir):
     
     print(f"Found {len(json_files)} JSON file(s) to process...\n")
     
-    # Process each JSON file
+    # Process each JSON file; results come back in file order
+    json_files = sorted(json_files)
+    jobs = jobs or os.cpu_count() or 1
+    output_dirs = [output_dir] * len(json_files)
+    
     success_count = 0
-    for json_file in sorted(json_files):
-        # Generate output filename
-        pdf_filename = json_file.stem + '.pdf'
-        pdf_path = output_dir / pdf_filename
-        
-        # Read JSON to get item count for logging
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            item_count = len(data.get('items', []))
-        except:
-            item_count = 0
-        
-        # Generate PDF
-        if create_pdf_from_json(json_file, pdf_path):
-            print(f"✅ Loaded {json_file.name} ({item_count} items)")
-            print(f"✅ Generated PDF: {pdf_path}")
-            success_count += 1
+    with ExitStack() as stack:
+        if jobs > 1 and len(json_files) > 1:
+            executor = stack.enter_context(
+                ProcessPoolExecutor(max_workers=min(jobs, len(json_files)))
+            )
+            results = executor.map(_process_one, json_files, output_dirs)
         else:
-            print(f"❌ Failed to process {json_file.name}")
-        print()
+            results = map(_process_one, json_files, output_dirs)
+        
+        for json_file, (pdf_path, item_count, success) in zip(json_files, results):
+            if success:
+                print(f"✅ Loaded {json_file.name} ({item_count} items)")
+                print(f"✅ Generated PDF: {pdf_path}")
+                success_count += 1
+            else:
+                print(f"❌ Failed to process {json_file.name}")
+            print()
     
     # Summary
     if success_count == len(json_files):
@@ -535,6 +570,12 @@ Examples:
         help='Output directory for PDFs (default: ../PDFs/)'
     )
     
+    parser.add_argument(
+        '-j', '--jobs',
+        type=int,
+        help='Worker processes for --all (default: one per CPU; 1 disables parallelism)'
+    )
+    
     parser.add_argument(
         '-o', '--output',
         type=str,
@@ -559,7 +600,7 @@ Examples:
     if args.all:
         # Process all files
         input_dir = (script_dir / '..' / 'Final' / 'Estimate-Json').resolve()
-        process_all_files(input_dir, output_dir)
+        process_all_files(input_dir, output_dir, jobs=args.jobs)
     elif args.json_file:
         # Process single file
         json_file_path = args.json_file
@@ -579,13 +620,8 @@ Examples:
             # Create output directory if it doesn't exist
             output_pdf_path.parent.mkdir(parents=True, exist_ok=True)
             # Generate PDF with specified output path
-            if create_pdf_from_json(json_path, output_pdf_path):
-                try:
-                    with open(json_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    item_count = len(data.get('items', []))
-                except:
-                    item_count = 0
+            success, item_count = _render_json_file(json_path, output_pdf_path)
+            if success:
                 print(f"✅ Generated PDF: {output_pdf_path} ({item_count} items)")
             else:
                 print(f"❌ Failed to generate PDF: {output_pdf_path}")
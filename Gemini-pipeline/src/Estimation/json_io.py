@@ -0,0 +1,33 @@
+"""
+JSON read/write helpers shared by the estimation scripts.
+
+Uses orjson when it is installed and the standard library otherwise. Kept
+free of other dependencies so generate_estimate_pdf.py can import it without
+pulling in estimate_builder.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads_json(data: Union[str, bytes]) -> Any:
+    """Parse JSON text or bytes.
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch
+    the same exception either way.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def encode_output_json(obj: Any) -> bytes:
+    """Encode obj as 2-space indented UTF-8 JSON for estimate output files."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
@@ -3,7 +3,6 @@
 Regenerate notes for test estimate and create PDF to verify formatting.
 """
 
-import json
 import sys
 from pathlib import Path
 
@@ -12,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from estimate_builder import _create_detailed_notes_from_items
 from generate_estimate_pdf import create_professional_pdf
+from json_io import encode_output_json, loads_json
 
 def regenerate_notes_and_pdf():
     """Regenerate notes with improved function and create PDF."""
@@ -23,8 +23,8 @@ def regenerate_notes_and_pdf():
     # Load test estimate
     test_file = Path(__file__).parent / "test-detailed-notes.json"
     
-    with open(test_file, 'r') as f:
-        estimate_data = json.load(f)
+    with open(test_file, 'rb') as f:
+        estimate_data = loads_json(f.read())
     
     items = estimate_data.get('items', [])
     
@@ -45,8 +45,7 @@ def regenerate_notes_and_pdf():
     
     # Save updated estimate
     output_json = Path(__file__).parent / "test-detailed-notes-regenerated.json"
-    with open(output_json, 'w') as f:
-        json.dump(estimate_data, f, indent=2)
+    output_json.write_bytes(encode_output_json(estimate_data))
     
     print(f"\n✅ Saved updated estimate: {output_json.name}")
     
@@ -40,6 +40,13 @@ except ImportError as exc:
         "jsonschema is required. Install it with 'pip install jsonschema'."
     ) from exc
 
+# Optional: fastjsonschema compiles the schema into a fast pass/fail check;
+# Draft7Validator still reports the errors when it fails
+try:
+    import fastjsonschema
+except ImportError:
+    fastjsonschema = None
+
 # Import annotation extractor (optional - gracefully fails if not available)
 try:
     # Add parent directory to path for pdf_annotation_extractor import
@@ -178,6 +185,13 @@ INSPECTION_SCHEMA: Dict[str, Any] = {
 
 _SCHEMA_VALIDATOR = Draft7Validator(INSPECTION_SCHEMA)
 
+# Compiled check for the common case of a valid response. It stops at the
+# first error, so failures are re-run through _SCHEMA_VALIDATOR to report
+# every problem.
+_FAST_SCHEMA_CHECK = (
+    fastjsonschema.compile(INSPECTION_SCHEMA) if fastjsonschema is not None else None
+)
+
 _CANONICAL_SECTIONS: Tuple[str, ...] = (
     "Foundations",
     "Grading and Drainage",
@@ -260,7 +274,11 @@ def deduplicate_issues(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
     
     from config import EXTRACTION_CONFIG
     
+    threshold = EXTRACTION_CONFIG["dedupe_similarity_threshold"]
     unique_issues = []
+    # One matcher per kept issue with its key as the second sequence, so
+    # difflib indexes each kept key once instead of on every comparison
+    unique_matchers: List[SequenceMatcher] = []
     
     for issue in issues:
         is_duplicate = False
@@ -268,13 +286,29 @@ def deduplicate_issues(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         # Create comparison key from section + location + description
         issue_key = f"{issue.get('section', '')}|{issue.get('location', '')}|{issue.get('description', '')}"
         
-        for unique_issue in unique_issues:
-            unique_key = f"{unique_issue.get('section', '')}|{unique_issue.get('location', '')}|{unique_issue.get('description', '')}"
-            
-            # Calculate similarity
-            similarity = SequenceMatcher(None, issue_key, unique_key).ratio()
+        issue_len = len(issue_key)
+        
+        for unique_issue, matcher in zip(unique_issues, unique_matchers):
+            unique_key = matcher.b
+            if issue_key == unique_key:
+                similarity = 1.0
+            else:
+                # ratio() can never exceed 2 * min(len) / (sum of lens), so
+                # keys too different in length cannot reach the threshold
+                unique_len = len(unique_key)
+                if 2.0 * min(issue_len, unique_len) / (issue_len + unique_len) < threshold:
+                    continue
+                
+                matcher.set_seq1(issue_key)
+                
+                # quick_ratio() is a cheap upper bound on ratio()
+                if matcher.quick_ratio() < threshold:
+                    continue
+                
+                # Calculate similarity
+                similarity = matcher.ratio()
             
-            if similarity >= EXTRACTION_CONFIG["dedupe_similarity_threshold"]:
+            if similarity >= threshold:
                 # Merge page references if it's a duplicate
                 unique_pages = set(unique_issue.get("page_refs", []))
                 unique_pages.update(issue.get("page_refs", []))
@@ -284,6 +318,7 @@ def deduplicate_issues(issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         
         if not is_duplicate:
             unique_issues.append(issue)
+            unique_matchers.append(SequenceMatcher(None, "", issue_key))
     
     logging.info(f"Deduplication: {len(issues)} → {len(unique_issues)} issues")
     return unique_issues
@@ -1180,6 +1215,13 @@ def _extract_partial_json(text: str) -> Optional[Dict[str, Any]]:
 
 def validate_schema(data: Dict[str, Any]) -> None:
     """Validate data against schema."""
+    if _FAST_SCHEMA_CHECK is not None:
+        try:
+            _FAST_SCHEMA_CHECK(data)
+            return
+        except fastjsonschema.JsonSchemaException:
+            pass  # Collect the full error list below
+
     errors = list(_SCHEMA_VALIDATOR.iter_errors(data))
     if not errors:
         return
@@ -9,6 +9,16 @@ GEMINI_GENERATION_CONFIG = {
     "candidate_count": 1,  # Single response
 }
 
+# Estimate pricing settings
+PRICING_CONFIG = {
+    "max_concurrent_requests": 8,  # Parallel per-issue Gemini calls (keep within RPM quota)
+    "rate_limit_retries": 5,  # Retries per issue on 429 / RESOURCE_EXHAUSTED
+    "rate_limit_backoff_seconds": 2,  # First wait after a rate-limit error (doubles each retry)
+    "rate_limit_backoff_max_seconds": 60,  # Backoff cap between rate-limit retries
+    "batch_poll_initial_seconds": 10,  # First wait before polling a --batch job
+    "batch_poll_max_seconds": 300,  # Backoff cap between batch job polls
+}
+
 # Extraction behavior settings
 EXTRACTION_CONFIG = {
     "retry_attempts": 3,